@@ -1,10 +1,16 @@
 import hashlib
 import logging
 import os
-from typing import List, Optional
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
 _model = None
 _load_error: Optional[str] = None
+_load_lock = threading.Lock()
 logger = logging.getLogger(__name__)
 
 # all-MiniLM-L6-v2 has a 512 WordPiece token limit.
@@ -30,22 +36,32 @@ def _load_model_once() -> bool:
         return True
     if _load_error is not None:
         return False
-    try:
-        from sentence_transformers import SentenceTransformer
+    with _load_lock:   # pipeline threads may all hit the first embed at once
+        if _model is not None:
+            return True
+        if _load_error is not None:
+            return False
         try:
-            from transformers.utils import logging as transformers_logging
-            transformers_logging.set_verbosity_error()
-            disable_progress = getattr(transformers_logging, "disable_progress_bar", None)
-            if callable(disable_progress):
-                disable_progress()
-        except Exception:
-            pass
-        _model = SentenceTransformer("all-MiniLM-L6-v2")
-        return True
-    except Exception as exc:
-        _load_error = str(exc)
-        logger.warning("Embedding model unavailable, using fallback embeddings: %s", exc)
-        return False
+            from sentence_transformers import SentenceTransformer
+            try:
+                from transformers.utils import logging as transformers_logging
+                transformers_logging.set_verbosity_error()
+                disable_progress = getattr(transformers_logging, "disable_progress_bar", None)
+                if callable(disable_progress):
+                    disable_progress()
+            except Exception:
+                pass
+            _model = SentenceTransformer(EMBEDDING_MODEL)
+            return True
+        except Exception as exc:
+            _load_error = str(exc)
+            logger.warning("Embedding model unavailable, using fallback embeddings: %s", exc)
+            return False
+
+
+def embedding_model_name() -> str:
+    """Name of the model producing vectors right now (the hash fallback is distinct)."""
+    return EMBEDDING_MODEL if _load_model_once() else "sha256-fallback"
 
 
 def _fallback_embedding(text: str, dim: int = 384) -> List[float]:
@@ -70,3 +86,39 @@ def get_embedding(text: str):
         except Exception as exc:
             logger.warning("Embedding encode failed, using fallback embedding: %s", exc)
     return _fallback_embedding(truncated)
+
+
+def get_embeddings(texts: List[str], batch_size: int = 32) -> List[Optional[object]]:
+    """
+    Batched get_embedding: one model.encode call for all non-empty texts.
+    Result is aligned with texts; empty inputs map to None.
+    """
+    results: List[Optional[object]] = [None] * len(texts)
+    positions = [i for i, text in enumerate(texts) if text and text.strip()]
+    if not positions:
+        return results
+    truncated = [_truncate(texts[i].strip()) for i in positions]
+    vectors = None
+    if _load_model_once():
+        try:
+            vectors = _model.encode(truncated, batch_size=batch_size, show_progress_bar=False)
+        except Exception as exc:
+            logger.warning("Batch embedding encode failed, using fallback embeddings: %s", exc)
+    if vectors is None:
+        vectors = [_fallback_embedding(text) for text in truncated]
+    for i, vector in zip(positions, vectors):
+        results[i] = vector
+    return results
+
+
+def quantize_int8(vector) -> Tuple[bytes, float]:
+    """
+    Symmetric per-vector int8 quantization: v ≈ q * scale with scale = max|v| / 127.
+    Returns (int8 bytes, scale). Cosine similarity is scale-invariant, so the
+    int8 vectors can be compared directly without dequantizing.
+    """
+    vec = np.asarray(vector, dtype=np.float32).ravel()
+    peak = float(np.max(np.abs(vec))) if vec.size else 0.0
+    scale = peak / 127.0 if peak > 0 else 1.0
+    q = np.clip(np.rint(vec / scale), -127, 127).astype(np.int8)
+    return q.tobytes(), scale
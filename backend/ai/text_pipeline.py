@@ -1,10 +1,24 @@
 import re
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+_TOKEN_RE = re.compile(r"\S+")
+_DOUBLE_PAIR_RE = re.compile(r"(.)\1")
+_REPEAT_2_RE = re.compile(r"(.)\1+")
+_REPEAT_3_RE = re.compile(r"(.)\1{2,}")
+# Same result as [ \t]+ -> " ", but lone spaces (the common case) are not rewritten
+_HSPACE_RE = re.compile(r"[ \t]{2,}|\t")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# Checked in order: Telugu wins over Devanagari wins over Arabic script.
+_SCRIPT_RES = (
+    ("te", re.compile(r"[\u0C00-\u0C7F]")),
+    ("hi", re.compile(r"[\u0900-\u097F]")),
+    ("ur", re.compile(r"[\u0600-\u06FF]")),
+)
 
 
 def _count_double_pairs(text: str) -> float:
     """Return fraction of characters that are part of exact 2x consecutive repeats."""
-    doubled = len(re.findall(r"(.)\1", text))
+    doubled = len(_DOUBLE_PAIR_RE.findall(text))
     return doubled * 2 / max(len(text), 1)
 
 
@@ -24,29 +38,38 @@ def _deduplicate_ocr_chars(text: str) -> str:
     pair_ratio = _count_double_pairs(text)
 
     if pair_ratio > 0.15:
-        # High duplication → whole-document 2x collapse first
-        def _halve_pairs(m: re.Match) -> str:
-            return m.group(0)[::2]  # keep every other char (first of each pair)
-
-        # Collapse runs of 2+ identical chars to 1 (handles 2x AND 4x)
-        collapsed = re.sub(r"(.)\1+", r"\1", text)
-        return collapsed
+        # High duplication → collapse runs of 2+ identical chars to 1 (handles 2x AND 4x)
+        return _REPEAT_2_RE.sub(r"\1", text)
 
     # Low global ratio → only collapse obvious 3+ runs (safer for normal text)
-    return re.sub(r"(.)\1{2,}", r"\1", text)
+    return _REPEAT_3_RE.sub(r"\1", text)
 
 
 def normalize_text(text: str) -> str:
     text = text or ""
     text = text.replace("\x00", " ")
     text = _deduplicate_ocr_chars(text)          # ← fix repeated-char OCR artefact
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _HSPACE_RE.sub(" ", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
+def count_tokens(text: str) -> int:
+    """Whitespace token count, same as len(text.split()) without building the list."""
+    return sum(1 for _ in _TOKEN_RE.finditer(text or ""))
+
+
 def split_paragraphs(text: str) -> List[Dict[str, str]]:
+    return _paragraphs_from_normalized(normalize_text(text))
+
+
+def normalize_and_split(text: str) -> Tuple[str, List[Dict[str, str]]]:
+    """normalize_text + split_paragraphs sharing a single normalization pass."""
     normalized = normalize_text(text)
+    return normalized, _paragraphs_from_normalized(normalized)
+
+
+def _paragraphs_from_normalized(normalized: str) -> List[Dict[str, str]]:
     raw_parts = [p.strip() for p in re.split(r"\n\s*\n", normalized) if p.strip()]
     if not raw_parts:
         raw_parts = [s.strip() for s in re.split(r"(?<=[.!?])\s+", normalized) if s.strip()]
@@ -55,12 +78,9 @@ def split_paragraphs(text: str) -> List[Dict[str, str]]:
 
 def detect_language_code(text: str) -> str:
     sample = (text or "")[:4000]
-    if re.search(r"[\u0C00-\u0C7F]", sample):
-        return "te"
-    if re.search(r"[\u0900-\u097F]", sample):
-        return "hi"
-    if re.search(r"[\u0600-\u06FF]", sample):
-        return "ur"
+    for code, script_re in _SCRIPT_RES:
+        if script_re.search(sample):
+            return code
     return "en"
 
 
@@ -16,6 +16,7 @@ Spec compliance:
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from backend.ai.groq_client import groq_generate, groq_is_configured
 from backend.ai.ollama_client import ollama_generate, ollama_is_configured
@@ -51,6 +52,9 @@ _DEEP_LANG: Dict[str, str] = {
     "pa": "pa", "gu": "gu",
 }
 
+# Upper bound on concurrent requests (per language, per chunk) inside one translate_text call.
+_MAX_TRANSLATE_WORKERS = 4
+
 # ─── Legal token protection patterns ─────────────────────────────────────────
 # Ordered: most specific first to avoid partial matches.
 _PROTECT_PATTERNS: List[str] = [
@@ -252,10 +256,18 @@ def _google_translate(text: str, lang_code: str) -> Tuple[str, Optional[str]]:
 
     try:
         chunks = _chunk_text(text, max_len=4500)
-        translated_parts: List[str] = []
-        for chunk in chunks:
-            result = _GT(source="auto", target=dt_code).translate(chunk)
-            translated_parts.append(result if result else chunk)
+
+        def _translate_chunk(chunk: str) -> str:
+            # GoogleTranslator keeps per-request state on the instance, so one per chunk
+            return _GT(source="auto", target=dt_code).translate(chunk)
+
+        if len(chunks) == 1:
+            results = [_translate_chunk(chunks[0])]
+        else:
+            # One request per ≤4500-char chunk; overlap them, keeping chunk order.
+            with ThreadPoolExecutor(max_workers=min(len(chunks), _MAX_TRANSLATE_WORKERS)) as pool:
+                results = list(pool.map(_translate_chunk, chunks))
+        translated_parts = [result if result else chunk for result, chunk in zip(results, chunks)]
         return "\n".join(translated_parts), None
     except Exception as exc:
         return text, f"Translation failed: {exc}"
@@ -320,6 +332,87 @@ def _llm_translate(text: str, lang_code: str) -> Tuple[str, Optional[str], Optio
     return best_text, None, best_model
 
 
+def _translate_one(
+    lang: str,
+    text: str,
+    protected_text: str,
+    protected_map: Dict[str, str],
+    source_language: str,
+) -> Optional[Dict[str, str]]:
+    """translate_text for a single target language; None for unknown codes."""
+    if lang not in LANGUAGE_NAMES and lang not in _DEEP_LANG:
+        return None
+
+    try:
+        if lang == "simple_en":
+            restored = _restore(_simplify_english(protected_text), protected_map)
+            return {
+                "language":        lang,
+                "translated_text": restored,
+                "source_language": source_language,
+                "model_used":      "rule-based simplification",
+                "error":           None,
+            }
+
+        elif lang == "en":
+            restored = _restore(protected_text, protected_map)
+            return {
+                "language":        lang,
+                "translated_text": restored,
+                "source_language": source_language,
+                "model_used":      "passthrough",
+                "error":           None,
+            }
+
+        elif lang in _DEEP_LANG:
+            llm_text, llm_error, llm_model = _llm_translate(protected_text, lang)
+            if not llm_error:
+                return {
+                    "language":        lang,
+                    "translated_text": _restore(llm_text, protected_map),
+                    "source_language": source_language,
+                    "model_used":      llm_model,
+                    "error":           None,
+                }
+            else:
+                raw_translated, error = _google_translate(protected_text, lang)
+                restored = _restore(raw_translated, protected_map)
+                if error:
+                    return {
+                        "language":        lang,
+                        "translated_text": text,   # original English
+                        "source_language": source_language,
+                        "model_used":      "english-fallback",
+                        "error":           f"{llm_error}; {error}",
+                    }
+                else:
+                    return {
+                        "language":        lang,
+                        "translated_text": restored,
+                        "source_language": source_language,
+                        "model_used":      "google-translate",
+                        "error":           None,
+                    }
+
+        else:
+            return {
+                "language":        lang,
+                "translated_text": text,
+                "source_language": source_language,
+                "model_used":      "english-fallback",
+                "error":           f"Language '{lang}' not supported",
+            }
+
+    except Exception as exc:
+        return {
+            "language":        lang,
+            "translated_text": text,  # English fallback, never empty
+            "source_language": source_language,
+            "model_used":      "english-fallback",
+            "error":           str(exc),
+        }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PUBLIC API
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -365,82 +458,18 @@ def translate_text(
     # Protect legal tokens + caller-supplied proper nouns
     protected_text, protected_map = _protect(text, extra_protect)
 
-    outputs: Dict[str, Dict[str, str]] = {}
-
-    for lang in langs:
-        if lang not in LANGUAGE_NAMES and lang not in _DEEP_LANG:
-            continue
-
-        try:
-            if lang == "simple_en":
-                restored = _restore(_simplify_english(protected_text), protected_map)
-                outputs[lang] = {
-                    "language":        lang,
-                    "translated_text": restored,
-                    "source_language": source_language,
-                    "model_used":      "rule-based simplification",
-                    "error":           None,
-                }
-
-            elif lang == "en":
-                restored = _restore(protected_text, protected_map)
-                outputs[lang] = {
-                    "language":        lang,
-                    "translated_text": restored,
-                    "source_language": source_language,
-                    "model_used":      "passthrough",
-                    "error":           None,
-                }
-
-            elif lang in _DEEP_LANG:
-                llm_text, llm_error, llm_model = _llm_translate(protected_text, lang)
-                if not llm_error:
-                    outputs[lang] = {
-                        "language":        lang,
-                        "translated_text": _restore(llm_text, protected_map),
-                        "source_language": source_language,
-                        "model_used":      llm_model,
-                        "error":           None,
-                    }
-                else:
-                    raw_translated, error = _google_translate(protected_text, lang)
-                    restored = _restore(raw_translated, protected_map)
-                    if error:
-                        outputs[lang] = {
-                            "language":        lang,
-                            "translated_text": text,   # original English
-                            "source_language": source_language,
-                            "model_used":      "english-fallback",
-                            "error":           f"{llm_error}; {error}",
-                        }
-                    else:
-                        outputs[lang] = {
-                            "language":        lang,
-                            "translated_text": restored,
-                            "source_language": source_language,
-                            "model_used":      "google-translate",
-                            "error":           None,
-                        }
-
-            else:
-                outputs[lang] = {
-                    "language":        lang,
-                    "translated_text": text,
-                    "source_language": source_language,
-                    "model_used":      "english-fallback",
-                    "error":           f"Language '{lang}' not supported",
-                }
-
-        except Exception as exc:
-            outputs[lang] = {
-                "language":        lang,
-                "translated_text": text,  # English fallback, never empty
-                "source_language": source_language,
-                "model_used":      "english-fallback",
-                "error":           str(exc),
-            }
-
-    return outputs
+    # Each target is an independent network round-trip (LLM / Google), so
+    # overlap them instead of paying the latencies back to back.
+    if len(langs) == 1:
+        results = [_translate_one(langs[0], text, protected_text, protected_map, source_language)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(langs), _MAX_TRANSLATE_WORKERS)) as pool:
+            results = list(pool.map(
+                lambda lang: _translate_one(lang, text, protected_text, protected_map, source_language),
+                langs,
+            ))
+
+    return {lang: out for lang, out in zip(langs, results) if out is not None}
 
 
 def translate_for_chatbot(
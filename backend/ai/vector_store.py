@@ -1,12 +1,20 @@
 import logging
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
-from backend.ai.embeddings import get_embedding
+from backend.ai.embeddings import embedding_model_name, get_embedding, get_embeddings
 
 logger = logging.getLogger(__name__)
 
+# Chunks embedded (and added to the index) per model call in VectorStore.load_from_db.
+LOAD_BATCH_SIZE = 64
+
+# Case-level similarity embeddings are computed over this many leading
+# characters of clean_text (or raw_text when clean_text is empty).
+SNIPPET_CHARS = 2500
+
 try:
     import faiss
 except Exception:
@@ -19,35 +27,54 @@ class VectorStore:
         self.index = faiss.IndexFlatL2(dim) if faiss is not None else None
         self.vectors = []       # fallback when faiss unavailable
         self.case_ids = []      # parallel list of case_number strings
+        self._lock = threading.Lock()   # keeps index rows and case_ids aligned across pipeline threads
 
     def add_case(self, case_id: str, text: str) -> None:
         emb = get_embedding(text)
         if emb is None:
             return
-        vec = np.array([emb], dtype="float32")
-        if self.index is not None:
-            self.index.add(vec)
-        else:
-            self.vectors.append(vec[0])
-        self.case_ids.append(case_id)
+        self.add_embeddings(case_id, [emb])
+
+    def add_embeddings(self, case_id: str, embeddings) -> None:
+        """Add precomputed embeddings (e.g. one per chunk) for case_id in one index call."""
+        if len(embeddings) == 0:
+            return
+        self.add_batch([case_id] * len(embeddings), embeddings)
+
+    def add_batch(self, case_ids: List[str], embeddings) -> None:
+        """Add precomputed embeddings, row i belonging to case_ids[i], in one index call."""
+        if len(embeddings) == 0:
+            return
+        vecs = np.asarray(embeddings, dtype="float32").reshape(-1, self.dim)
+        with self._lock:
+            if self.index is not None:
+                self.index.add(vecs)
+            else:
+                self.vectors.extend(vecs)
+            self.case_ids.extend(case_ids)
 
     def search(self, text: str, k: int = 5):
         emb = get_embedding(text)
         if emb is None:
             return []
-        vec = np.array([emb], dtype="float32")
-
-        if self.index is not None and len(self.case_ids) > 0:
-            _, I = self.index.search(vec, min(k, len(self.case_ids)))
-            indices = [int(i) for i in I[0]]        # cast np.intp → int
-        elif self.vectors:
-            query = vec[0]
-            dists = [float(np.linalg.norm(query - v)) for v in self.vectors]
-            indices = [int(i) for i in np.argsort(dists)[:k]]
-        else:
-            return []
+        return self.search_by_vector(emb, k)
+
+    def search_by_vector(self, emb, k: int = 5):
+        """search() for an already-computed query embedding (skips the model call)."""
+        vec = np.asarray(emb, dtype="float32").reshape(1, self.dim)
+
+        with self._lock:
+            if self.index is not None and len(self.case_ids) > 0:
+                _, I = self.index.search(vec, min(k, len(self.case_ids)))
+                indices = [int(i) for i in I[0]]        # cast np.intp → int
+            elif self.vectors:
+                query = vec[0]
+                dists = [float(np.linalg.norm(query - v)) for v in self.vectors]
+                indices = [int(i) for i in np.argsort(dists)[:k]]
+            else:
+                return []
 
-        return [self.case_ids[i] for i in indices if 0 <= i < len(self.case_ids)]
+            return [self.case_ids[i] for i in indices if 0 <= i < len(self.case_ids)]
 
     def load_from_db(self, db=None) -> int:
         """
@@ -66,6 +93,19 @@ class VectorStore:
                 return 0
 
         loaded = 0
+        with self._lock:
+            seen = set(self.case_ids)     # set lookup; `cn in self.case_ids` was O(n) per chunk
+        pending_ids: List[str] = []
+        pending_texts: List[str] = []
+
+        def _flush() -> int:
+            vectors = get_embeddings(pending_texts, batch_size=LOAD_BATCH_SIZE)
+            kept = [(cn, v) for cn, v in zip(pending_ids, vectors) if v is not None]
+            self.add_batch([cn for cn, _ in kept], [v for _, v in kept])
+            pending_ids.clear()
+            pending_texts.clear()
+            return len(kept)
+
         try:
             # Use case_chunks collection (text + case_number stored by pipeline)
             cursor = db["case_chunks"].find(
@@ -77,18 +117,15 @@ class VectorStore:
                 if not cn or not text:
                     continue
                 # Only add if this case_number not already in index
-                if cn in self.case_ids:
+                if cn in seen:
                     continue
-                emb = get_embedding(text)
-                if emb is None:
-                    continue
-                vec = np.array([emb], dtype="float32")
-                if self.index is not None:
-                    self.index.add(vec)
-                else:
-                    self.vectors.append(vec[0])
-                self.case_ids.append(cn)
-                loaded += 1
+                seen.add(cn)
+                pending_ids.append(cn)
+                pending_texts.append(text)
+                if len(pending_texts) >= LOAD_BATCH_SIZE:
+                    loaded += _flush()
+            if pending_texts:
+                loaded += _flush()
         except Exception as exc:
             logger.warning("VectorStore.load_from_db: error during reload — %s", exc)
 
@@ -96,5 +133,138 @@ class VectorStore:
         return loaded
 
 
-# Global singleton — populated at startup by main.py lifespan or app startup event
+class SimilarityIndex:
+    """
+    Approximate nearest-neighbour index (FAISS HNSW, inner product) over the
+    int8 snippet embeddings stored on raw_judgments.similarity_embedding
+    (only those produced by the current embedding model).
+    Vectors are L2-normalised on insert so inner product == cosine.
+    Inactive (available == False) when faiss is not installed.
+
+    HNSW cannot delete, so a changed vector for a case is appended as a new row
+    and the old row is skipped at search time. Once superseded rows pass
+    REBUILD_STALE_FRACTION of the index it is rebuilt from the live rows.
+    """
+
+    REBUILD_STALE_FRACTION = 0.25
+
+    def __init__(self, dim: int = 384, m: int = 32, ef_construction: int = 200, ef_search: int = 128) -> None:
+        self.dim = dim
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.index = None
+        self.case_numbers: List[str] = []      # row -> case_number, superseded rows included
+        self._live: Dict[str, Tuple[int, int]] = {}    # case_number -> (current row, hash of its int8 bytes)
+        self._stale = 0
+        self._lock = threading.Lock()
+        if faiss is not None:
+            self.index = self._new_index()
+
+    def _new_index(self):
+        index = faiss.IndexHNSWFlat(self.dim, self.m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = self.ef_construction
+        index.hnsw.efSearch = self.ef_search
+        return index
+
+    def _rebuild(self) -> None:
+        """Re-index only the live rows, dropping superseded ones. Caller holds the lock."""
+        rows = sorted(row for row, _ in self._live.values())
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)[rows]     # already normalised
+        index = self._new_index()
+        index.add(vectors)
+        self.case_numbers = [self.case_numbers[row] for row in rows]
+        self._live = {cn: (row, self._live[cn][1]) for row, cn in enumerate(self.case_numbers)}
+        self._stale = 0
+        self.index = index
+
+    @property
+    def available(self) -> bool:
+        return self.index is not None
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def _normalise(self, q8_rows: List[np.ndarray]) -> np.ndarray:
+        mat = np.stack(q8_rows).astype("float32")
+        norms = np.linalg.norm(mat, axis=1, keepdims=True)
+        return mat / np.maximum(norms, 1e-12)
+
+    def add_many(self, items) -> int:
+        """Add (case_number, int8 vector) pairs; a case already indexed with the same vector is skipped."""
+        if self.index is None:
+            return 0
+        with self._lock:
+            fresh = {}
+            for case_number, q8 in items:
+                if not case_number or q8 is None or q8.size != self.dim:
+                    continue
+                digest = hash(q8.tobytes())
+                current = self._live.get(case_number)
+                if current is not None and current[1] == digest:
+                    continue
+                fresh[case_number] = (q8, digest)
+            if not fresh:
+                return 0
+            row = len(self.case_numbers)
+            for case_number, (_, digest) in fresh.items():
+                if case_number in self._live:
+                    self._stale += 1
+                self._live[case_number] = (row, digest)
+                self.case_numbers.append(case_number)
+                row += 1
+            self.index.add(self._normalise([q8 for q8, _ in fresh.values()]))
+            if self._stale > self.REBUILD_STALE_FRACTION * len(self.case_numbers):
+                self._rebuild()
+            return len(fresh)
+
+    def search(self, q8: np.ndarray, k: int) -> List[str]:
+        if self.index is None or q8 is None or q8.size != self.dim:
+            return []
+        with self._lock:
+            if not self._live:
+                return []
+            # Over-fetch by the superseded rows that may crowd out live ones
+            _, I = self.index.search(self._normalise([q8]), min(k + self._stale, len(self.case_numbers)))
+            hits = []
+            for i in I[0]:
+                i = int(i)
+                if 0 <= i < len(self.case_numbers) and self._live[self.case_numbers[i]][0] == i:
+                    hits.append(self.case_numbers[i])
+            return hits[:k]
+
+    def load_from_db(self, db=None) -> int:
+        """Bulk-load every stored similarity embedding. Called once at startup."""
+        if self.index is None:
+            return 0
+        if db is None:
+            try:
+                from backend.database.mongo import get_db
+                db = get_db()
+            except Exception as exc:
+                logger.warning("SimilarityIndex.load_from_db: cannot connect to DB — %s", exc)
+                return 0
+
+        loaded = 0
+        batch = []
+        try:
+            cursor = db["raw_judgments"].find(
+                {"similarity_embedding.q8": {"$exists": True}, "similarity_embedding.model": embedding_model_name()},
+                {"case_number": 1, "similarity_embedding.q8": 1},
+            )
+            for doc in cursor:
+                batch.append((doc.get("case_number"), np.frombuffer(doc["similarity_embedding"]["q8"], dtype=np.int8)))
+                if len(batch) >= 1000:
+                    loaded += self.add_many(batch)
+                    batch = []
+            loaded += self.add_many(batch)
+        except Exception as exc:
+            logger.warning("SimilarityIndex.load_from_db: error during reload — %s", exc)
+
+        logger.info("SimilarityIndex loaded %d case embeddings from MongoDB.", loaded)
+        return loaded
+
+
+# Global singletons — populated at startup by main.py lifespan or app startup event
 vector_store = VectorStore()
+similarity_index = SimilarityIndex()
@@ -1,12 +1,35 @@
 import logging
 
-from pymongo import MongoClient
+from pymongo import ASCENDING, DESCENDING, MongoClient
 from pymongo.errors import PyMongoError
 
-from .settings import MONGO_DB, MONGO_URI
+from .settings import MONGO_COMPRESSORS, MONGO_DB, MONGO_URI
 
 logger = logging.getLogger(__name__)
 
+# Hot-path lookup keys per collection. Non-unique on purpose: re-uploading the
+# same judgment creates a second raw_judgments document with the same case_number
+# (and the same content_sha256).
+_INDEXES = {
+    "raw_judgments":       [[("case_number", ASCENDING)], [("created_at", DESCENDING)],
+                            [("content_sha256", ASCENDING)]],
+    "case_summaries":      [[("case_number", ASCENDING)], [("case_id", ASCENDING)]],
+    "case_translations":   [[("case_number", ASCENDING), ("language", ASCENDING), ("mode", ASCENDING)],
+                            [("case_id", ASCENDING)]],
+    "case_predictions":    [[("case_number", ASCENDING)], [("case_id", ASCENDING)]],
+    "case_chunks":         [[("case_number", ASCENDING)], [("case_id", ASCENDING), ("chunk_index", ASCENDING)]],
+    "embeddings_metadata": [[("case_number", ASCENDING)], [("case_id", ASCENDING)]],
+    "case_facts":          [[("case_id", ASCENDING)]],
+    "processing_queue":    [[("case_number", ASCENDING)], [("status", ASCENDING), ("updated_at", ASCENDING)]],
+    "ai_outputs":          [[("case_number", ASCENDING), ("created_at", DESCENDING)], [("created_at", DESCENDING)]],
+    "similar_cases_cache": [[("case_number", ASCENDING), ("top_k", ASCENDING)]],
+}
+# Content-addressed caches and upsert keys: the key must identify exactly one document.
+_UNIQUE_INDEXES = {
+    "embedding_cache":     [[("hash", ASCENDING), ("model", ASCENDING)]],
+    "processing_queue":    [[("case_id", ASCENDING)]],     # enqueue_case upserts on case_id
+}
+
 
 class MongoDB:
     client: MongoClient = None
@@ -15,7 +38,8 @@ class MongoDB:
 
 def connect_to_mongo() -> bool:
     try:
-        client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000, connectTimeoutMS=5000)
+        options = {"compressors": MONGO_COMPRESSORS} if MONGO_COMPRESSORS else {}
+        client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000, connectTimeoutMS=5000, **options)
         client.admin.command("ping")
         MongoDB.client = client
         MongoDB.db = MongoDB.client[MONGO_DB]
@@ -31,6 +55,18 @@ def connect_to_mongo() -> bool:
         return False
 
 
+def ensure_indexes() -> None:
+    """Create the hot-path indexes. create_index is idempotent, so this is safe on every startup."""
+    db = get_db()
+    for unique, spec in ((False, _INDEXES), (True, _UNIQUE_INDEXES)):
+        for collection, indexes in spec.items():
+            for keys in indexes:
+                try:
+                    db[collection].create_index(keys, unique=unique)
+                except PyMongoError as exc:
+                    logger.warning("Index creation skipped for %s %s: %s", collection, keys, exc)
+
+
 def close_mongo_connection():
     if MongoDB.client:
         MongoDB.client.close()
@@ -45,3 +81,14 @@ def get_db():
     if MongoDB.db is None:
         raise RuntimeError("MongoDB not connected. Verify MONGO_URI/network and restart the backend.")
     return MongoDB.db
+
+
+def get_corpus_version() -> int:
+    """Counter bumped whenever the searchable judgment corpus changes."""
+    doc = get_db()["cache_versions"].find_one({"_id": "raw_judgments"})
+    return int((doc or {}).get("version", 0))
+
+
+def bump_corpus_version() -> None:
+    """Invalidate corpus-derived caches (e.g. similar_cases_cache)."""
+    get_db()["cache_versions"].update_one({"_id": "raw_judgments"}, {"$inc": {"version": 1}}, upsert=True)
@@ -1,10 +1,44 @@
+import threading
+
 import mysql.connector
-from .settings import MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB
+from mysql.connector import errors, pooling
+from .settings import MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB, MYSQL_POOL_SIZE
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _connect_args() -> dict:
+    return {
+        "host": MYSQL_HOST,
+        "user": MYSQL_USER,
+        "password": MYSQL_PASSWORD,
+        "database": MYSQL_DB,
+    }
+
+
+def _get_pool() -> pooling.MySQLConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name="legal_ai",
+                    pool_size=MYSQL_POOL_SIZE,
+                    pool_reset_session=True,
+                    **_connect_args(),
+                )
+    return _pool
+
 
 def get_mysql_connection():
-    return mysql.connector.connect(
-        host=MYSQL_HOST,
-        user=MYSQL_USER,
-        password=MYSQL_PASSWORD,
-        database=MYSQL_DB
-    )
+    """
+    Borrow a connection from the shared pool; conn.close() hands it back.
+    The pool is created on first use, so a MySQL outage at import time is
+    retried on the next call. If every pooled connection is busy, fall back
+    to a one-off direct connection rather than failing the request.
+    """
+    try:
+        return _get_pool().get_connection()
+    except errors.PoolError:
+        return mysql.connector.connect(**_connect_args())
@@ -10,10 +10,13 @@ load_dotenv(dotenv_path=ENV_PATH)
 
 MONGO_URI = os.getenv("MONGO_URI")
 MONGO_DB = os.getenv("MONGO_DB")
+MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "zlib").strip()  # wire compression, e.g. "zstd,zlib"; empty disables
 MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
 MYSQL_USER = os.getenv("MYSQL_USER", "root")
 MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "naseer")
 MYSQL_DB = os.getenv("MYSQL_DB", "legal_ai")
+PIPELINE_WORKERS = max(1, int(os.getenv("PIPELINE_WORKERS", "4")))
+MYSQL_POOL_SIZE = max(1, min(32, int(os.getenv("MYSQL_POOL_SIZE", "10"))))  # mysql-connector caps pools at 32
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "").strip()
 GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile").strip()
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434").strip()
@@ -1,13 +1,32 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import re
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s | %(name)s | %(message)s")
 
+
+def _queue_log_handlers(logger_name: str) -> None:
+    """Swap a logger's handlers for a QueueHandler; one listener thread does the actual writes."""
+    target = logging.getLogger(logger_name)
+    if not target.handlers:
+        return
+    listener = logging.handlers.QueueListener(queue.SimpleQueue(), *target.handlers, respect_handler_level=True)
+    target.handlers = [logging.handlers.QueueHandler(listener.queue)]
+    listener.start()
+    atexit.register(listener.stop)
+
+
+# Request handlers only enqueue log records instead of blocking on stdout
+for _logger_name in ("", "uvicorn.access"):
+    _queue_log_handlers(_logger_name)
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from backend.database.mongo import connect_to_mongo, close_mongo_connection, is_mongo_connected
+from backend.database.mongo import connect_to_mongo, close_mongo_connection, ensure_indexes, is_mongo_connected
 from backend.routes.raw_judgment_routes import router as raw_judgment_router
 from backend.routes.upload_routes import router as upload_router
 from backend.routes.ai_routes import router as ai_router
@@ -17,8 +36,9 @@ from backend.routes.prediction_routes import router as prediction_router
 from backend.routes.dashboard_routes import router as dashboard_router
 from backend.routes.feedback_routes import router as feedback_router
 from backend.routes.manual_prediction_routes import router as manual_prediction_router
+from backend.services.ocr_batcher import ocr_batcher
 from backend.services.pipeline_worker import pipeline_worker
-from backend.ai.vector_store import vector_store
+from backend.ai.vector_store import similarity_index, vector_store
 
 DEFAULT_ALLOWED_ORIGINS = [
     "http://localhost:5173",
@@ -84,6 +104,7 @@ def startup():
         print("[startup] MongoDB unavailable: worker startup and vector-store reload skipped.")
         return
 
+    ensure_indexes()
     pipeline_worker.start()
     # Re-load previously embedded cases into in-memory vector index so
     # similarity search works immediately without re-processing documents.
@@ -92,12 +113,16 @@ def startup():
         print(f"[startup] Vector store loaded {loaded} chunks from MongoDB.")
     except Exception as exc:
         print(f"[startup] Vector store reload skipped: {exc}")
+    if similarity_index.available:
+        loaded = similarity_index.load_from_db()
+        print(f"[startup] Similarity index loaded {loaded} case embeddings from MongoDB.")
 
 # ---- shutdown ----
 @app.on_event("shutdown")
 def shutdown():
     if is_mongo_connected():
         pipeline_worker.stop()
+    ocr_batcher.shutdown()
     close_mongo_connection()
 
 # ---- routes ----
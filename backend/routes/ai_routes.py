@@ -4,6 +4,8 @@ Fixed AI routes:
 - /translate  → translates basic_summary + key_points (NOT raw document text)
 - /case/{case_id} → returns full stored case for similar-case viewer
 """
+import asyncio
+
 from fastapi import APIRouter
 from backend.database.mongo import get_db
 from backend.database.mysql import get_mysql_connection
@@ -37,15 +39,26 @@ def _key_points_to_lines(key_points):
 
 # ─── /summarize/{case_number} ────────────────────────────────────────────────
 @router.get("/summarize/{case_number:path}")
-def summarize_case(case_number: str, languages: str = "en"):
+def summarize_case(case_number: str, languages: str = "en", force: bool = False):
     db = get_db()
     case = db["raw_judgments"].find_one({"case_number": case_number})
     if not case:
         return {"error": "Case not found"}
 
-    text = case.get("judgment_text", {}).get("clean_text") or case.get("judgment_text", {}).get("raw_text", "")
-    structured = summarize_structured(text)
-    basic      = make_basic_summary(text)
+    # ── Cache check: reuse the stored summary unless force=true ─────────────
+    stored_summary = None if force else db["case_summaries"].find_one({"case_number": case_number})
+    cached = bool(stored_summary and stored_summary.get("key_points"))
+    if cached:
+        structured = {
+            "short_summary":    stored_summary.get("short_summary"),
+            "detailed_summary": stored_summary.get("detailed_summary"),
+            "key_points":       stored_summary.get("key_points"),
+        }
+        basic = stored_summary.get("basic_summary") or stored_summary.get("short_summary") or ""
+    else:
+        text = case.get("judgment_text", {}).get("clean_text") or case.get("judgment_text", {}).get("raw_text", "")
+        structured = summarize_structured(text)
+        basic      = make_basic_summary(text)
 
     # Merge basic into structured result
     structured["basic_summary"] = basic
@@ -70,12 +83,35 @@ def summarize_case(case_number: str, languages: str = "en"):
     translation_source = f"{basic}\n\nKey Points:\n" + "\n".join(
         [f"{i+1}. {p}" for i, p in enumerate(key_lines)]
     )
-    translation_map = translate_text(
-        translation_source,
-        target_languages=requested_langs,
-        source_language="en",
-        extra_protect=extra_protect or None,
-    )
+
+    # On a summary cache hit, previously stored summary translations are still
+    # valid, so only the missing languages go through the translation model.
+    translation_map = {}
+    pending_langs = requested_langs
+    if cached:
+        pending_langs = []
+        for lang_code in requested_langs:
+            hit = None
+            if lang_code != "en":
+                hit = db["case_translations"].find_one(
+                    {"case_number": case_number, "language": lang_code, "mode": "summary"}
+                )
+            if hit and hit.get("translated_text"):
+                translation_map[lang_code] = {
+                    "language":        lang_code,
+                    "translated_text": hit["translated_text"],
+                    "model_used":      hit.get("model_used", "cached"),
+                    "error":           None,
+                }
+            else:
+                pending_langs.append(lang_code)
+    if pending_langs:
+        translation_map.update(translate_text(
+            translation_source,
+            target_languages=pending_langs,
+            source_language="en",
+            extra_protect=extra_protect or None,
+        ))
 
     multilingual_summary = {}
     for lang_code in requested_langs:
@@ -103,28 +139,30 @@ def summarize_case(case_number: str, languages: str = "en"):
     kp = key_lines
     summary_str = "\n".join([f"- {p}" for p in kp])
 
-    db["case_summaries"].update_one(
-        {"case_id": case_id},
-        {"$set": {
-            "case_id":       case_id,
-            "case_number":   case_number,
-            "summary":       summary_str,
-            "short_summary": structured.get("short_summary"),
-            "basic_summary": basic,
-            "detailed_summary": structured.get("detailed_summary"),
-            "key_points":    structured.get("key_points"),
-        }},
-        upsert=True,
-    )
+    if not cached:
+        db["case_summaries"].update_one(
+            {"case_id": case_id},
+            {"$set": {
+                "case_id":       case_id,
+                "case_number":   case_number,
+                "summary":       summary_str,
+                "short_summary": structured.get("short_summary"),
+                "basic_summary": basic,
+                "detailed_summary": structured.get("detailed_summary"),
+                "key_points":    structured.get("key_points"),
+            }},
+            upsert=True,
+        )
 
-    if case_id_mysql:
+    if case_id_mysql and not cached:
         conn = cursor = None
         try:
             conn   = get_mysql_connection()
             cursor = conn.cursor()
-            cursor.execute("DELETE FROM case_summaries WHERE case_id=%s", (case_id_mysql,))
             cursor.execute(
-                "INSERT INTO case_summaries (case_id, summary_type, summary_text, model_used) VALUES (%s,%s,%s,%s)",
+                "INSERT INTO case_summaries (case_id, summary_type, summary_text, model_used) VALUES (%s,%s,%s,%s) "
+                "ON DUPLICATE KEY UPDATE summary_type=VALUES(summary_type), summary_text=VALUES(summary_text), "
+                "model_used=VALUES(model_used), created_at=CURRENT_TIMESTAMP",
                 (case_id_mysql, "judgment", summary_str, "rule-based"),
             )
             conn.commit()
@@ -138,19 +176,22 @@ def summarize_case(case_number: str, languages: str = "en"):
         "case_number": case_number,
         "summary": structured,
         "summary_multilingual": multilingual_summary,
+        "cached": cached,
     }
 
 
 # ─── /translate/{case_number} ────────────────────────────────────────────────
 @router.get("/translate/{case_number:path}")
-def translate_case(case_number: str, language: str = "hi", mode: str = "summary"):
+def translate_case(case_number: str, language: str = "hi", mode: str = "summary", force: bool = False):
     """
     Translate a case to a regional language.
     mode=summary (default): translate basic_summary + key_points  ← spec default
     mode=raw              : translate the full clean document text (user-initiated only)
 
     Cache-first: if a translation for (case_number, language, mode) already
-    exists in MongoDB, return it immediately without re-translating.
+    exists in MongoDB — or, for mode=summary, the pipeline already stored one
+    for this language — return it immediately without re-translating.
+    Pass force=true to bypass the cache.
 
     Legal tokens (section numbers, act names, dates) and party/judge names
     are protected from translation via placeholder substitution.
@@ -164,9 +205,19 @@ def translate_case(case_number: str, language: str = "hi", mode: str = "summary"
         return {"error": "Case not found"}
 
     # ── Cache check ─────────────────────────────────────────────────────────
-    cached = db["case_translations"].find_one(
-        {"case_number": case_number, "language": language, "mode": mode}
-    )
+    cached = None
+    if not force:
+        cached = db["case_translations"].find_one(
+            {"case_number": case_number, "language": language, "mode": mode}
+        )
+        if not (cached and cached.get("translated_text")) and mode == "summary":
+            # Pipeline stores summary translations as {translation: {lang: {...}}}
+            pipeline_doc = db["case_translations"].find_one(
+                {"case_number": case_number, f"translation.{language}": {"$exists": True}},
+                {f"translation.{language}": 1},
+            )
+            if pipeline_doc:
+                cached = (pipeline_doc.get("translation") or {}).get(language)
     if cached and cached.get("translated_text"):
         return {
             "case_number":      case_number,
@@ -311,24 +362,33 @@ def get_case_by_id(case_id: str):
 
 # ─── /analyze/{case_number} ──────────────────────────────────────────────────
 @router.get("/analyze/{case_number:path}")
-def full_case_analysis(case_number: str, language: str = "en"):
+async def full_case_analysis(case_number: str, language: str = "en"):
     db = get_db()
-    case = db["raw_judgments"].find_one({"case_number": case_number})
+    case = await asyncio.to_thread(db["raw_judgments"].find_one, {"case_number": case_number})
     if not case:
         return {"error": "Case not found"}
 
     text      = case.get("judgment_text", {}).get("clean_text") or case.get("judgment_text", {}).get("raw_text", "")
-    summaries = summarize_structured(text)
-    basic     = make_basic_summary(text)
-    summaries["basic_summary"] = basic
 
-    key_lines = _key_points_to_lines(summaries.get("key_points", []))
-    translate_src = basic + "\n\nKey Points:\n" + "\n".join(key_lines)
-    translation_map = translate_text(translate_src, [language])
+    # Translation needs the summary output, so summarize → translate runs as one
+    # chain; similarity search and prediction only need the text and run alongside it.
+    def _summarize_and_translate():
+        summaries = summarize_structured(text)
+        basic     = make_basic_summary(text)
+        summaries["basic_summary"] = basic
+
+        key_lines = _key_points_to_lines(summaries.get("key_points", []))
+        translate_src = basic + "\n\nKey Points:\n" + "\n".join(key_lines)
+        translation_map = translate_text(translate_src, [language])
+        return summaries, translate_src, translation_map
+
+    (summaries, translate_src, translation_map), similar, pred = await asyncio.gather(
+        asyncio.to_thread(_summarize_and_translate),
+        asyncio.to_thread(find_similar_cases, case_number, 5),
+        asyncio.to_thread(predict_case_with_history, text),
+    )
     tsel  = translation_map.get(language, {"translated_text": translate_src, "model_used": "fallback"})
-    similar = find_similar_cases(case_number, top_k=5)
     similar_cases = similar.get("similar_cases", []) if isinstance(similar, dict) else []
-    pred  = predict_case_with_history(text)
 
     return {
         "translation": {
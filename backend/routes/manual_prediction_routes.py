@@ -2,9 +2,10 @@
 Manual prediction API — accepts structured feature inputs, returns probability.
 Uses weighted scoring rules — no ML model needed, fully deterministic.
 """
+from functools import lru_cache
 from fastapi import APIRouter
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Tuple
 
 router = APIRouter(prefix="/predict", tags=["Manual Prediction"])
 
@@ -97,7 +98,42 @@ W_RELIEF    = 0.20
 
 
 def _lookup(table: dict, key: str, default: float = 0.60) -> float:
-    return table.get(key.strip().lower(), default)
+    return table.get(key, default)
+
+
+@lru_cache(maxsize=8192)
+def _score(
+    case_type: str,
+    court_level: str,
+    dispute_type: str,
+    evidence_strength: str,
+    delay_in_filing: bool,
+    relief_type: str,
+) -> Tuple[float, float, float, float, float]:
+    """
+    Fused weighted score over pre-normalized (stripped, lower-cased) inputs.
+    Inputs are free-form strings, so the space is unbounded; results are
+    memoized and the lru_cache bound (8192 entries) is what caps memory.
+    Returns (score, ev_score, court_sc, dispute_sc, relief_sc).
+    """
+    ev_score  = _lookup(_EVIDENCE_SCORE, evidence_strength, 0.58)
+    delay_sc  = 0.30 if delay_in_filing else 0.82
+    court_sc  = _lookup(_COURT_SCORE, court_level, 0.62)
+    dispute_sc= _lookup(_DISPUTE_SCORE, dispute_type, 0.60)
+    relief_sc = _lookup(_RELIEF_SCORE, relief_type, 0.62)
+
+    raw = (
+        W_EVIDENCE * ev_score
+        + W_DELAY   * delay_sc
+        + W_COURT   * court_sc
+        + W_DISPUTE * dispute_sc
+        + W_RELIEF  * relief_sc
+    )
+
+    # Apply case-type modifier
+    modifier = _CASE_TYPE_MODIFIER.get(case_type, 0.0)
+    score = max(0.05, min(0.95, raw + modifier))
+    return score, ev_score, court_sc, dispute_sc, relief_sc
 
 
 @router.post("/manual")
@@ -111,24 +147,15 @@ def predict_manual(data: PredictionInput):
     - relief_type      (20%)
     + case_type modifier
     """
-    ev_score  = _lookup(_EVIDENCE_SCORE, data.evidence_strength, 0.58)
-    delay_sc  = 0.30 if data.delay_in_filing else 0.82
-    court_sc  = _lookup(_COURT_SCORE, data.court_level, 0.62)
-    dispute_sc= _lookup(_DISPUTE_SCORE, data.dispute_type, 0.60)
-    relief_sc = _lookup(_RELIEF_SCORE, data.relief_type, 0.62)
-
-    raw = (
-        W_EVIDENCE * ev_score
-        + W_DELAY   * delay_sc
-        + W_COURT   * court_sc
-        + W_DISPUTE * dispute_sc
-        + W_RELIEF  * relief_sc
+    score, ev_score, court_sc, dispute_sc, relief_sc = _score(
+        data.case_type.strip().lower(),
+        data.court_level.strip().lower(),
+        data.dispute_type.strip().lower(),
+        data.evidence_strength.strip().lower(),
+        bool(data.delay_in_filing),
+        data.relief_type.strip().lower(),
     )
 
-    # Apply case-type modifier
-    modifier = _CASE_TYPE_MODIFIER.get(data.case_type.strip().lower(), 0.0)
-    score = max(0.05, min(0.95, raw + modifier))
-
     plaintiff_pct = round(score * 100)
     defendant_pct = 100 - plaintiff_pct
 
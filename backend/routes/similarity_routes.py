@@ -1,16 +1,32 @@
 import re
 import logging
-from typing import List, Set
+from datetime import datetime, timedelta
+from typing import List, Optional, Set
 
+import numpy as np
 from fastapi import APIRouter
+from pymongo import UpdateOne
 
-from backend.ai.embeddings import get_embedding
-from backend.database.mongo import get_db
+from backend.ai.embeddings import embedding_model_name, get_embedding, quantize_int8
+from backend.ai.vector_store import SNIPPET_CHARS, similarity_index
+from backend.database.mongo import get_corpus_version, get_db
 from backend.database.mysql import get_mysql_connection
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+MAX_CANDIDATES = 2500
+# Once the corpus outgrows the exact scan window, candidates come from the HNSW
+# index instead: over-fetch this many semantic neighbours, then rerank with keywords.
+ANN_SHORTLIST = 200
+# Cached results are reused until the corpus version changes or the TTL lapses.
+SIMILAR_CACHE_TTL = timedelta(hours=6)
+
+_SECTION_RE = re.compile(r"\b(?:section|sec\.?)\s*(\d+[a-z\-]*)")
+_ACTS = ("ipc", "crpc", "constitution", "evidence act", "contract act")
+# One left-to-right pass finds every act instead of one substring scan per act.
+_ACT_RE = re.compile("|".join(re.escape(act) for act in _ACTS))
+
 
 def _extract_keywords(case_doc) -> Set[str]:
     keywords: Set[str] = set()
@@ -23,87 +39,175 @@ def _extract_keywords(case_doc) -> Set[str]:
             keywords.add(f"section {section}")
 
     text = (
-        case_doc.get("judgment_text", {}).get("clean_text")
+        case_doc.get("snippet")
+        or case_doc.get("judgment_text", {}).get("clean_text")
         or case_doc.get("judgment_text", {}).get("raw_text", "")
     ).lower()
-    for m in re.finditer(r"\b(?:section|sec\.?)\s*(\d+[a-z\-]*)", text):
+    for m in _SECTION_RE.finditer(text):
         keywords.add(f"section {m.group(1)}")
-    for act in ["ipc", "crpc", "constitution", "evidence act", "contract act"]:
-        if act in text:
-            keywords.add(act)
+    found_acts = set()
+    for m in _ACT_RE.finditer(text):
+        found_acts.add(m.group(0))
+        if len(found_acts) == len(_ACTS):
+            break
+    keywords |= found_acts
     return keywords
 
 
-def _cosine(a, b) -> float:
-    if a is None or b is None:
-        return 0.0
-    import math
-
-    n = min(len(a), len(b))
-    if n == 0:
-        return 0.0
-    dot = sum(float(a[i]) * float(b[i]) for i in range(n))
-    na = math.sqrt(sum(float(a[i]) * float(a[i]) for i in range(n)))
-    nb = math.sqrt(sum(float(b[i]) * float(b[i]) for i in range(n)))
-    if na == 0 or nb == 0:
-        return 0.0
-    return dot / (na * nb)
+def _q8_embedding(doc, text: str, pending: List[UpdateOne]) -> Optional[np.ndarray]:
+    """
+    Return the doc's int8 snippet embedding, reusing the one stored on the
+    document when it came from the current embedding model. Freshly computed
+    vectors are queued in `pending` so the caller can persist them in one bulk write.
+    """
+    model = embedding_model_name()
+    stored = doc.get("similarity_embedding") or {}
+    if stored.get("q8") and stored.get("model") == model:
+        return np.frombuffer(stored["q8"], dtype=np.int8)
+    if not text:
+        return None
+    emb = get_embedding(text)
+    if emb is None:
+        return None
+    q8, scale = quantize_int8(emb)
+    pending.append(
+        UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {"similarity_embedding": {"q8": q8, "scale": scale, "dim": len(q8), "model": model}}},
+        )
+    )
+    return np.frombuffer(q8, dtype=np.int8)
 
 
 def find_similar_cases(case_number: str, top_k: int = 5):
     db = get_db()
+    corpus_version = get_corpus_version()
+    cached = db["similar_cases_cache"].find_one({"case_number": case_number, "top_k": top_k})
+    if (
+        cached
+        and cached.get("corpus_version") == corpus_version
+        and datetime.utcnow() - cached.get("created_at", datetime.min) < SIMILAR_CACHE_TTL
+    ):
+        return {"case_number": case_number, "keywords": cached["keywords"], "similar_cases": cached["similar_cases"]}
+
     source = db["raw_judgments"].find_one({"case_number": case_number})
     if not source:
         return {"error": "case not found"}
 
     source_text = source.get("judgment_text", {}).get("clean_text") or source.get("judgment_text", {}).get("raw_text", "")
     source_kw = _extract_keywords(source)
-    source_emb = get_embedding(source_text[:2500]) if source_text else None
-    if not source_kw and source_emb is None:
+    pending: List[UpdateOne] = []
+    source_q = _q8_embedding(source, source_text[:SNIPPET_CHARS], pending)
+    if not source_kw and source_q is None:
         return {"case_number": case_number, "keywords": [], "similar_cases": []}
 
-    candidates = db["raw_judgments"].find(
-        {"case_number": {"$ne": case_number}},
-        {"_id": 1, "case_number": 1, "title": 1, "court_name": 1, "acts_sections": 1,
-         "case_metadata": 1, "judgment_text.clean_text": 1, "judgment_text.raw_text": 1},
-    ).limit(2500)
+    # Only the first SNIPPET_CHARS of each candidate are ever scored, so let Mongo
+    # cut the text server-side instead of shipping whole judgments over the wire.
+    clean_or_raw = {
+        "$cond": [
+            {"$gt": [{"$strLenCP": {"$ifNull": ["$judgment_text.clean_text", ""]}}, 0]},
+            "$judgment_text.clean_text",
+            {"$ifNull": ["$judgment_text.raw_text", ""]},
+        ]
+    }
+    match = {"case_number": {"$ne": case_number}}
+    if source_q is not None and similarity_index.available and len(similarity_index) > MAX_CANDIDATES:
+        shortlist = [cn for cn in similarity_index.search(source_q, ANN_SHORTLIST + 1) if cn != case_number]
+        if shortlist:
+            match = {"case_number": {"$in": shortlist}}
 
-    scored = []
+    candidates = db["raw_judgments"].aggregate([
+        {"$match": match},
+        {"$limit": MAX_CANDIDATES},
+        {"$project": {
+            "_id": 1, "case_number": 1, "title": 1, "court_name": 1, "acts_sections": 1,
+            "case_metadata.court_name": 1, "case_metadata.case_type": 1,
+            "similarity_embedding": 1,
+            "snippet": {"$substrCP": [clean_or_raw, 0, SNIPPET_CHARS]},
+        }},
+    ])
+
+    # Struct-of-arrays: per-candidate scores go into flat arrays so the 65/35
+    # blend and top-k selection run as vector ops instead of a Python sort.
+    metas = []
+    inter_sz = []
+    union_sz = []
+    q_rows = []     # int8 candidate embeddings (None when not scorable)
     for doc in candidates:
         target_cn = doc.get("case_number")
         if not target_cn:
             continue
         target_kw = _extract_keywords(doc)
         inter = source_kw & target_kw
-        kw_score = len(inter) / max(1, len(source_kw | target_kw)) if source_kw or target_kw else 0.0
 
-        target_text = doc.get("judgment_text", {}).get("clean_text") or doc.get("judgment_text", {}).get("raw_text", "")
-        sem_score = 0.0
-        if source_emb is not None and target_text:
-            target_emb = get_embedding(target_text[:2500])
-            sem_score = _cosine(source_emb, target_emb)
+        target_q = None
+        if source_q is not None:
+            target_q = _q8_embedding(doc, doc.get("snippet", ""), pending)
 
-        # Weighted rank: sections/acts keywords dominate, semantic refines ties.
-        final_score = 0.65 * kw_score + 0.35 * max(0.0, sem_score)
-        if final_score <= 0:
-            continue
-        scored.append(
-            (
-                final_score,
-                {
-                    "case_id":      str(doc.get("_id", "")),
-                    "case_number":  target_cn,
-                    "title":        doc.get("title", ""),
-                    "court":        doc.get("court_name") or doc.get("case_metadata", {}).get("court_name", ""),
-                    "case_type":    doc.get("case_metadata", {}).get("case_type", ""),
-                    "similarity_score": float(round(final_score, 4)),
-                    "matched_keywords": sorted(list(inter))[:12],
-                },
-            )
+        inter_sz.append(len(inter))
+        union_sz.append(len(source_kw | target_kw))
+        q_rows.append(target_q)
+        metas.append(
+            {
+                "case_id":      str(doc.get("_id", "")),
+                "case_number":  target_cn,
+                "title":        doc.get("title", ""),
+                "court":        doc.get("court_name") or doc.get("case_metadata", {}).get("court_name", ""),
+                "case_type":    doc.get("case_metadata", {}).get("case_type", ""),
+                "matched_keywords": sorted(list(inter))[:12],
+            }
+        )
+
+    if pending:
+        try:
+            db["raw_judgments"].bulk_write(pending, ordered=False)
+        except Exception as exc:
+            logger.warning("Could not persist similarity embeddings: %s", exc)
+        similarity_index.add_many(
+            [(m["case_number"], q) for m, q in zip(metas, q_rows) if q is not None]
+            + [(case_number, source_q)]
         )
 
-    top = [item for _, item in sorted(scored, key=lambda x: x[0], reverse=True)[:top_k]]
-    return {"case_number": case_number, "keywords": sorted(list(source_kw))[:25], "similar_cases": top}
+    top = []
+    if metas:
+        # Cosine on the int8 vectors directly: integer matmul over the candidate
+        # matrix, normalised by the int8 norms (the per-vector scales cancel out).
+        sem = np.zeros(len(metas), dtype=np.float64)
+        rows = [i for i, q in enumerate(q_rows) if q is not None and q.size == source_q.size]
+        if rows:
+            mat = np.stack([q_rows[i] for i in rows]).astype(np.int32)
+            src = source_q.astype(np.int32)
+            dots = (mat @ src).astype(np.float64)
+            norms = np.linalg.norm(mat, axis=1) * np.linalg.norm(src)
+            sem[rows] = np.divide(dots, norms, out=np.zeros(len(rows)), where=norms > 0)
+
+        kw = np.asarray(inter_sz, dtype=np.int32) / np.maximum(1, np.asarray(union_sz, dtype=np.int32))
+        # Weighted rank: sections/acts keywords dominate, semantic refines ties.
+        final = 0.65 * kw + 0.35 * np.clip(sem, 0.0, None)
+        positive = np.flatnonzero(final > 0)
+        if positive.size > top_k:
+            # Keep everything scoring at least the k-th best, ties included, so the
+            # stable sort below still breaks ties by candidate order
+            kth = np.partition(final[positive], positive.size - top_k)[positive.size - top_k]
+            positive = positive[final[positive] >= kth]
+        order = positive[np.argsort(-final[positive], kind="stable")]
+        for i in order[:top_k]:
+            item = metas[i]
+            item["similarity_score"] = float(round(float(final[i]), 4))
+            top.append(item)
+
+    keywords = sorted(list(source_kw))[:25]
+    db["similar_cases_cache"].update_one(
+        {"case_number": case_number, "top_k": top_k},
+        {"$set": {
+            "keywords":       keywords,
+            "similar_cases":  top,
+            "corpus_version": corpus_version,
+            "created_at":     datetime.utcnow(),
+        }},
+        upsert=True,
+    )
+    return {"case_number": case_number, "keywords": keywords, "similar_cases": top}
 
 
 @router.get("/search/{case_number:path}")
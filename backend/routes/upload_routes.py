@@ -11,33 +11,92 @@ Flow:
 7. Enqueue background pipeline worker
 """
 
+import asyncio
+import hashlib
+import logging
 import os
-import shutil
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 
 from fastapi import APIRouter, File, UploadFile
 
-from backend.ai.text_pipeline import detect_language_code, normalize_text, split_paragraphs
-from backend.database.mongo import get_db
+from backend.ai.text_pipeline import count_tokens, detect_language_code, normalize_and_split
+from backend.database.mongo import bump_corpus_version, get_db
 from backend.database.mysql import get_mysql_connection
 from backend.services.metadata_pipeline import process_document_metadata
+from backend.services.ocr_batcher import ocr_batcher
 from backend.services.pipeline_worker import enqueue_case
 from backend.utils.case_extractor import validate_metadata_for_sql
-from backend.utils.ocr_processor import extract_text
 
 router = APIRouter(prefix="/cases", tags=["Cases"])
+logger = logging.getLogger(__name__)
 
 UPLOAD_DIR = "uploads"
+UPLOAD_CHUNK_SIZE = 1 << 20
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 
+_NLP_CACHE_SIZE = 64
+_nlp_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_nlp_cache_lock = threading.Lock()
+
+
+def _prepare_text(extracted_text: str):
+    """Normalize, paragraph-split, token-count and language-detect OCR text (run off the event loop).
+
+    Re-ingesting the same judgment is common, so results are memoized in a
+    small LRU keyed by a blake2b digest of the text alone (the raw text is not
+    kept). The cached paragraphs list is shared; treat it as read-only.
+    """
+    digest = hashlib.blake2b(extracted_text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _nlp_cache_lock:
+        if digest in _nlp_cache:
+            _nlp_cache.move_to_end(digest)
+            return _nlp_cache[digest]
+    clean_text, paragraphs = normalize_and_split(extracted_text)
+    language_code = detect_language_code(extracted_text)
+    bundle = (clean_text, paragraphs, language_code, count_tokens(clean_text))
+    with _nlp_cache_lock:
+        _nlp_cache[digest] = bundle
+        while len(_nlp_cache) > _NLP_CACHE_SIZE:
+            _nlp_cache.popitem(last=False)
+    return bundle
+
+
+def _save_upload(src, file_path: str) -> str:
+    """Copy the spooled upload to disk in 1 MB chunks and return its SHA-256 (run off the event loop)."""
+    sha256 = hashlib.sha256()
+    with open(file_path, "wb") as buf:
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            sha256.update(chunk)
+            buf.write(chunk)
+    return sha256.hexdigest()
+
+
+# cases columns filled from meta, in INSERT order (after case_number)
+_SQL_FIELDS = (
+    "case_prefix", "case_number_numeric", "case_year", "title",
+    "court_name", "court_level", "bench", "case_type",
+    "filing_date", "registration_date", "decision_date",
+    "petitioner", "respondent", "judge_names", "advocates",
+    "disposition", "citation",
+)
+_UNKNOWN_VALUES = frozenset(("", "unknown"))
+
+
 def _v(val):
     """Return None if val is None, empty, or 'unknown'."""
     if val is None:
         return None
     s = str(val).strip()
-    return None if (not s or s.lower() == "unknown") else s
+    return None if s.lower() in _UNKNOWN_VALUES else s
+
+
+def _sql_values(meta: dict) -> tuple:
+    """Column values for _SQL_FIELDS, each normalised by _v."""
+    return tuple(_v(meta.get(f)) for f in _SQL_FIELDS)
 
 
 def _upsert_case_sql(case_number: str, meta: dict, file_path: str) -> int | None:
@@ -48,14 +107,15 @@ def _upsert_case_sql(case_number: str, meta: dict, file_path: str) -> int | None
     Returns internal case_id on success, None on error or rejection.
     """
     if not case_number or case_number.startswith("CASE-"):
-        print(f"[upload] SQL insert skipped - no real case_number detected ({case_number})")
+        logger.info("SQL insert skipped - no real case_number detected (%s)", case_number)
         return None
 
     conn = None
     cursor = None
     try:
         conn = get_mysql_connection()
-        cursor = conn.cursor()
+        # Binary-protocol prepared cursor: typed params, no client-side escaping
+        cursor = conn.cursor(prepared=True)
 
         cursor.execute(
             """
@@ -66,7 +126,7 @@ def _upsert_case_sql(case_number: str, meta: dict, file_path: str) -> int | None
                 petitioner, respondent, judge_names, advocates,
                 disposition, citation, source, pdf_url
             )
-            VALUES (%s, %s, %s, %s,  %s, %s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s, %s)
             ON DUPLICATE KEY UPDATE
                 case_prefix         = COALESCE(VALUES(case_prefix),        case_prefix),
                 case_number_numeric = COALESCE(VALUES(case_number_numeric),case_number_numeric),
@@ -85,38 +145,23 @@ def _upsert_case_sql(case_number: str, meta: dict, file_path: str) -> int | None
                 advocates          = COALESCE(VALUES(advocates),          advocates),
                 disposition        = COALESCE(VALUES(disposition),        disposition),
                 citation           = COALESCE(VALUES(citation),           citation),
-                pdf_url            = COALESCE(VALUES(pdf_url),            pdf_url)
+                pdf_url            = COALESCE(VALUES(pdf_url),            pdf_url),
+                case_id            = LAST_INSERT_ID(case_id)
             """,
             (
                 case_number,
-                _v(meta.get("case_prefix")),
-                _v(meta.get("case_number_numeric")),
-                _v(meta.get("case_year")),
-                _v(meta.get("title")),
-                _v(meta.get("court_name")),
-                _v(meta.get("court_level")),
-                _v(meta.get("bench")),
-                _v(meta.get("case_type")),
-                _v(meta.get("filing_date")),
-                _v(meta.get("registration_date")),
-                _v(meta.get("decision_date")),
-                _v(meta.get("petitioner")),
-                _v(meta.get("respondent")),
-                _v(meta.get("judge_names")),
-                _v(meta.get("advocates")),
-                _v(meta.get("disposition")),
-                _v(meta.get("citation")),
+                *_sql_values(meta),
                 "upload",
                 file_path,
             ),
         )
         conn.commit()
 
-        cursor.execute("SELECT case_id FROM cases WHERE case_number = %s", (case_number,))
-        row = cursor.fetchone()
-        return int(row[0]) if row else None
+        # LAST_INSERT_ID(case_id) in the UPDATE branch makes lastrowid the
+        # existing row's id too, so no follow-up SELECT round-trip is needed.
+        return int(cursor.lastrowid) if cursor.lastrowid else None
     except Exception as exc:
-        print(f"[upload] SQL insert error: {exc}")
+        logger.warning("SQL insert error: %s", exc)
         return None
     finally:
         if cursor:
@@ -132,23 +177,30 @@ async def upload_case(file: UploadFile = File(...)):
 
         internal_case_number = f"CASE-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6].upper()}"
         file_path = os.path.join(UPLOAD_DIR, f"{internal_case_number}_{file.filename}")
-        print(f"[upload] Saving file -> {file_path}")
-        with open(file_path, "wb") as buf:
-            shutil.copyfileobj(file.file, buf)
-
-        print("[upload] Running OCR...")
-        extracted_text = extract_text(file_path)
-        print(f"[upload] OCR done - {len(extracted_text)} chars")
+        logger.info("Saving file -> %s", file_path)
+        content_sha256 = await asyncio.to_thread(_save_upload, file.file, file_path)
+
+        # Identical bytes were OCR'd before -> reuse that text instead of re-running OCR
+        previous = await asyncio.to_thread(
+            db["raw_judgments"].find_one,
+            {"content_sha256": content_sha256, "judgment_text.raw_text": {"$nin": [None, ""]}},
+            {"judgment_text.raw_text": 1},
+        )
+        if previous:
+            extracted_text = previous["judgment_text"]["raw_text"]
+            logger.info("Duplicate content %s - reusing OCR text from %s", content_sha256[:12], previous["_id"])
+        else:
+            logger.info("Running OCR...")
+            extracted_text = await ocr_batcher.extract_text(file_path)
+            logger.info("OCR done - %d chars", len(extracted_text))
 
         if not extracted_text or not extracted_text.strip():
             return {"error": "OCR returned empty text"}
 
-        clean_text = normalize_text(extracted_text)
-        paragraphs = split_paragraphs(extracted_text)
-        language_code = detect_language_code(extracted_text)
+        clean_text, paragraphs, language_code, token_count = await asyncio.to_thread(_prepare_text, extracted_text)
 
-        print("[upload] Extracting metadata...")
-        metadata_result = process_document_metadata(extracted_text, internal_case_number)
+        logger.info("Extracting metadata...")
+        metadata_result = await asyncio.to_thread(process_document_metadata, extracted_text, internal_case_number)
         meta = metadata_result["final_meta"]
 
         extracted_cn = meta.get("case_number")
@@ -173,11 +225,26 @@ async def upload_case(file: UploadFile = File(...)):
             title = extracted_cn or internal_case_number
         meta["title"] = title
 
+        logger.info("Validating metadata for SQL...")
+        is_valid, rejection_reason = validate_metadata_for_sql(meta, collect_all=True)
+        quality_passed = bool(metadata_result.get("quality_gate_passed"))
+        quality_reasons = metadata_result.get("quality_gate_reasons") or []
+        sql_allowed = bool(metadata_result.get("sql_write_allowed"))
+        sql_write = is_valid and quality_passed and sql_allowed
+        if not sql_write:
+            reasons = []
+            if rejection_reason:
+                reasons.append(rejection_reason)
+            reasons.extend(quality_reasons)
+            reason_text = "; ".join(reasons) if reasons else "quality gate blocked"
+            logger.info("SQL insert REJECTED - %s", reason_text)
+
         now = datetime.utcnow()
         document = {
             "source_type": "upload",
             "case_number": case_number,
             "title": title,
+            "content_sha256": content_sha256,
             "file_info": {
                 "file_name": file.filename,
                 "stored_path": file_path,
@@ -188,9 +255,10 @@ async def upload_case(file: UploadFile = File(...)):
                 "clean_text": clean_text,
                 "paragraphs": paragraphs,
                 "language": language_code,
-                "token_count": len(clean_text.split()),
+                "token_count": token_count,
             },
             "case_metadata": meta,
+            "case_id_mysql": None,
             "processing_status": "cleaned",
             "nlp_flags": {
                 "text_cleaned": True,
@@ -206,38 +274,34 @@ async def upload_case(file: UploadFile = File(...)):
             "last_updated_at": now,
         }
 
-        result = db["raw_judgments"].insert_one(document)
-        case_id = result.inserted_id
-        print(f"[upload] MongoDB inserted -> {case_id}")
-
-        print("[upload] Validating metadata for SQL...")
-        is_valid, rejection_reason = validate_metadata_for_sql(meta)
-        quality_passed = bool(metadata_result.get("quality_gate_passed"))
-        quality_reasons = metadata_result.get("quality_gate_reasons") or []
-        sql_allowed = bool(metadata_result.get("sql_write_allowed"))
-        if not (is_valid and quality_passed and sql_allowed):
-            reasons = []
-            if rejection_reason:
-                reasons.append(rejection_reason)
-            reasons.extend(quality_reasons)
-            reason_text = "; ".join(reasons) if reasons else "quality gate blocked"
-            print(f"[upload] SQL insert REJECTED - {reason_text}")
-            case_id_mysql = None
+        # The Mongo insert and the MySQL upsert are independent, so overlap them;
+        # case_id_mysql is linked with a follow-up update only when SQL ran.
+        mongo_task = asyncio.to_thread(db["raw_judgments"].insert_one, document)
+        if sql_write:
+            logger.info("Inserting SQL metadata...")
+            sql_task = asyncio.to_thread(_upsert_case_sql, case_number, meta, file_path)
+            result, case_id_mysql = await asyncio.gather(mongo_task, sql_task)
         else:
-            print("[upload] Inserting SQL metadata...")
-            case_id_mysql = _upsert_case_sql(case_number, meta, file_path)
+            result, case_id_mysql = await mongo_task, None
+        case_id = result.inserted_id
+        logger.info("MongoDB inserted -> %s", case_id)
 
+        # Corpus version bump and case_id_mysql link are independent writes
+        followups = [asyncio.to_thread(bump_corpus_version)]
         if case_id_mysql:
-            db["raw_judgments"].update_one(
+            followups.append(asyncio.to_thread(
+                db["raw_judgments"].update_one,
                 {"_id": case_id},
                 {"$set": {"case_id_mysql": case_id_mysql}},
-            )
-            print(f"[upload] SQL inserted -> case_id={case_id_mysql}")
+            ))
+        await asyncio.gather(*followups)
+        if case_id_mysql:
+            logger.info("SQL inserted -> case_id=%s", case_id_mysql)
         else:
-            print("[upload] SQL insert skipped (error or duplicate)")
+            logger.info("SQL insert skipped (error or duplicate)")
 
         enqueue_case(case_id=case_id, case_number=case_number, stage="extracted")
-        print("[upload] Enqueued pipeline worker")
+        logger.info("Enqueued pipeline worker")
 
         return {
             "status": "stored",
@@ -265,39 +329,56 @@ async def upload_case(file: UploadFile = File(...)):
             },
         }
     except Exception as e:
-        print(f"[upload] ERROR: {e}")
+        logger.exception("Upload failed: %s", e)
         return {"error": str(e)}
 
 
+# case_features only reports on judgment_text, so compute the flags server-side
+# instead of shipping multi-MB raw/clean text over the wire.
+_FEATURES_PROJECTION = {
+    "has_raw_text": {"$ne": [{"$ifNull": ["$judgment_text.raw_text", ""]}, ""]},
+    "has_clean_text": {"$ne": [{"$ifNull": ["$judgment_text.clean_text", ""]}, ""]},
+    "paragraph_count": {
+        "$cond": [{"$isArray": "$judgment_text.paragraphs"}, {"$size": "$judgment_text.paragraphs"}, 0]
+    },
+    "language": "$judgment_text.language",
+    "processing_status": 1,
+    "nlp_flags": 1,
+    "case_metadata": 1,
+}
+_TRANSLATION_LANGS_PROJECTION = {
+    "langs": {"$map": {"input": {"$objectToArray": {"$ifNull": ["$translation", {}]}}, "in": "$$this.k"}},
+}
+
+
 @router.get("/features/{case_number:path}")
-def case_features(case_number: str):
+async def case_features(case_number: str):
     db = get_db()
-    case_doc = db["raw_judgments"].find_one({"case_number": case_number})
+    query = {"case_number": case_number}
+    # Independent lookups, all on indexed case_number: overlap the round-trips
+    case_doc, summary, translation, chunk, embedding, prediction = await asyncio.gather(
+        asyncio.to_thread(db["raw_judgments"].find_one, query, _FEATURES_PROJECTION),
+        asyncio.to_thread(db["case_summaries"].find_one, query, {"summary": 1}),
+        asyncio.to_thread(db["case_translations"].find_one, query, _TRANSLATION_LANGS_PROJECTION),
+        asyncio.to_thread(db["case_chunks"].find_one, query, {"_id": 1}),
+        asyncio.to_thread(db["embeddings_metadata"].find_one, query, {"_id": 1}),
+        asyncio.to_thread(db["case_predictions"].find_one, query, {"_id": 1}),
+    )
     if not case_doc:
         return {"error": "case not found"}
 
-    summary = db["case_summaries"].find_one({"case_number": case_number})
-    translation = db["case_translations"].find_one({"case_number": case_number})
-    chunks_count = db["case_chunks"].count_documents({"case_number": case_number})
-    emb_count = db["embeddings_metadata"].count_documents({"case_number": case_number})
-    prediction = db["case_predictions"].find_one({"case_number": case_number})
-
-    raw_text = case_doc.get("judgment_text", {}).get("raw_text", "")
-    clean_text = case_doc.get("judgment_text", {}).get("clean_text", "")
-    langs = []
-    if translation and translation.get("translation"):
-        langs = list(translation.get("translation", {}).keys())
+    langs = (translation or {}).get("langs") or []
 
     return {
         "case_number": case_number,
-        "ocr_extracted": bool(raw_text),
-        "cleaned_text_available": bool(clean_text),
-        "paragraph_count": len(case_doc.get("judgment_text", {}).get("paragraphs", [])),
-        "language_code": case_doc.get("judgment_text", {}).get("language", "unknown"),
+        "ocr_extracted": bool(case_doc.get("has_raw_text")),
+        "cleaned_text_available": bool(case_doc.get("has_clean_text")),
+        "paragraph_count": case_doc.get("paragraph_count", 0),
+        "language_code": case_doc.get("language", "unknown"),
         "summary_available": bool(summary and summary.get("summary")),
         "multilanguage_available": len(langs) > 0,
         "languages": langs,
-        "rag_ready": chunks_count > 0 and emb_count > 0,
+        "rag_ready": chunk is not None and embedding is not None,
         "prediction_available": bool(prediction),
         "processing_status": case_doc.get("processing_status"),
         "nlp_flags": case_doc.get("nlp_flags", {}),
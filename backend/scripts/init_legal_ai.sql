@@ -55,6 +55,7 @@ CREATE TABLE IF NOT EXISTS case_summaries (
     summary_text TEXT,
     model_used VARCHAR(100),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY uk_case_summaries_case_id (case_id),
     FOREIGN KEY (case_id) REFERENCES cases(case_id) ON DELETE CASCADE
 );
 
@@ -65,6 +66,7 @@ CREATE TABLE IF NOT EXISTS case_translations (
     translated_summary TEXT,
     model_used VARCHAR(100),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY uk_case_translations_case_lang (case_id, language_code),
     FOREIGN KEY (case_id) REFERENCES cases(case_id) ON DELETE CASCADE
 );
 
@@ -77,6 +79,7 @@ CREATE TABLE IF NOT EXISTS case_predictions (
     key_factors TEXT,
     model_version VARCHAR(50),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY uk_case_predictions_case_id (case_id),
     FOREIGN KEY (case_id) REFERENCES cases(case_id) ON DELETE CASCADE
 );
 
@@ -94,7 +97,8 @@ CREATE TABLE IF NOT EXISTS case_audit_logs (
     quality_gate_passed BOOLEAN DEFAULT FALSE,
     quality_gate_reasons JSON,
     sql_write_allowed BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    KEY ix_case_audit_logs_case_id (case_id)
 );
 
 ALTER TABLE case_audit_logs
@@ -109,7 +113,8 @@ CREATE TABLE IF NOT EXISTS learning_feedback (
     predicted_value TEXT,
     corrected_value TEXT,
     source ENUM('rule', 'ai', 'final', 'manual') DEFAULT 'manual',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    KEY ix_learning_feedback_created_at (created_at)
 );
 
 CREATE TABLE IF NOT EXISTS similar_cases (
@@ -148,3 +153,67 @@ CREATE TABLE IF NOT EXISTS system_logs (
     details TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+
+-- Hot-path lookup indexes for databases created before they were declared above
+-- (cases.case_number is already UNIQUE; similar_cases.case_id is covered by its
+-- foreign key index). MySQL has no CREATE INDEX IF NOT EXISTS, so each ALTER is
+-- guarded by an information_schema lookup.
+DROP PROCEDURE IF EXISTS add_index_if_missing;
+DROP PROCEDURE IF EXISTS drop_index_if_present;
+DELIMITER //
+CREATE PROCEDURE add_index_if_missing(IN tbl VARCHAR(64), IN idx VARCHAR(64), IN ddl TEXT)
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = tbl AND index_name = idx
+    ) THEN
+        SET @ddl = ddl;
+        PREPARE stmt FROM @ddl;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END //
+
+CREATE PROCEDURE drop_index_if_present(IN tbl VARCHAR(64), IN idx VARCHAR(64))
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = tbl AND index_name = idx
+    ) THEN
+        SET @ddl = CONCAT('ALTER TABLE `', tbl, '` DROP INDEX `', idx, '`');
+        PREPARE stmt FROM @ddl;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END //
+DELIMITER ;
+
+CALL add_index_if_missing('case_audit_logs', 'ix_case_audit_logs_case_id',
+    'ALTER TABLE case_audit_logs ADD INDEX ix_case_audit_logs_case_id (case_id)');
+CALL add_index_if_missing('learning_feedback', 'ix_learning_feedback_created_at',
+    'ALTER TABLE learning_feedback ADD INDEX ix_learning_feedback_created_at (created_at)');
+
+-- One summary / prediction row per case and one translation per (case, language):
+-- the pipeline upserts these with INSERT ... ON DUPLICATE KEY UPDATE. Older runs
+-- appended a row per pass, so keep only the newest duplicate before adding the keys.
+DELETE old FROM case_summaries old
+    JOIN case_summaries newer ON newer.case_id = old.case_id AND newer.summary_id > old.summary_id;
+DELETE old FROM case_translations old
+    JOIN case_translations newer
+        ON newer.case_id = old.case_id
+        AND newer.language_code <=> old.language_code
+        AND newer.translation_id > old.translation_id;
+DELETE old FROM case_predictions old
+    JOIN case_predictions newer ON newer.case_id = old.case_id AND newer.prediction_id > old.prediction_id;
+
+CALL add_index_if_missing('case_summaries', 'uk_case_summaries_case_id',
+    'ALTER TABLE case_summaries ADD UNIQUE KEY uk_case_summaries_case_id (case_id)');
+CALL add_index_if_missing('case_translations', 'uk_case_translations_case_lang',
+    'ALTER TABLE case_translations ADD UNIQUE KEY uk_case_translations_case_lang (case_id, language_code)');
+CALL add_index_if_missing('case_predictions', 'uk_case_predictions_case_id',
+    'ALTER TABLE case_predictions ADD UNIQUE KEY uk_case_predictions_case_id (case_id)');
+-- Earlier one-language-per-case key (dropped after the new key can back the foreign key)
+CALL drop_index_if_present('case_translations', 'uk_case_translations_case_id');
+
+DROP PROCEDURE add_index_if_missing;
+DROP PROCEDURE drop_index_if_present;
@@ -150,7 +150,7 @@ def insert_audit_log(audit_payload: Dict) -> None:
 
 def process_document_metadata(text: str, case_id: str) -> Dict[str, object]:
     rule_meta = extract_case_metadata(text)
-    is_rule_valid, validation_reason = validate_metadata_for_sql(rule_meta)
+    is_rule_valid, validation_reason = validate_metadata_for_sql(rule_meta, collect_all=True)
 
     ollama_meta = None
     groq_meta = None
@@ -167,7 +167,7 @@ def process_document_metadata(text: str, case_id: str) -> Dict[str, object]:
     learning_result = apply_learning(merged_meta)
     final_meta = learning_result["metadata"]
     applied_rules = learning_result["applied_rules"]
-    final_is_valid, final_validation_reason = validate_metadata_for_sql(final_meta)
+    final_is_valid, final_validation_reason = validate_metadata_for_sql(final_meta, collect_all=True)
     confidence_score = calculate_confidence(
         rule_valid=is_rule_valid,
         used_ai=used_ai,
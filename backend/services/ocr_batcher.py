@@ -0,0 +1,166 @@
+"""
+Coalescing OCR queue for uploads.
+
+Concurrent uploads put (file_path, future) on one asyncio queue. A background
+task drains up to OCR_MAX_BATCH requests (or whatever arrives within
+OCR_BATCH_WINDOW_SECONDS) and hands them to the OCR process pool as
+per-worker batches, so each worker OCRs several files per round-trip while
+the batch as a whole still runs in parallel.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Set, Tuple
+
+from backend.utils import ocr_backends, ocr_processor
+from backend.utils.ocr_processor import extract_text
+
+# One single-threaded Tesseract per worker (see _ocr_worker_init), so one worker per core
+OCR_WORKERS = max(1, os.cpu_count() or 4)
+OCR_MAX_BATCH = 16
+OCR_BATCH_WINDOW_SECONDS = 0.05
+logger = logging.getLogger(__name__)
+
+
+def _ocr_worker_init() -> None:
+    # One Tesseract thread per worker: the pool already provides the parallelism
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    # ...so each worker reads its PDFs serially instead of starting its own page
+    # pool (PDF_WORKERS more processes per worker) and OCR thread pool
+    ocr_processor.PDF_WORKERS = 1
+    ocr_processor.OCR_CONCURRENCY = 1
+
+
+def _extract_batch(file_paths: List[str]) -> List[Tuple[Optional[str], Optional[Exception]]]:
+    """Worker-side: OCR several files in one call. Errors are returned per file."""
+    results: List[Tuple[Optional[str], Optional[Exception]]] = []
+    for file_path in file_paths:
+        try:
+            results.append((extract_text(file_path), None))
+        except Exception as exc:
+            results.append((None, exc))
+    return results
+
+
+class OcrBatcher:
+    def __init__(
+        self,
+        workers: int = OCR_WORKERS,
+        max_batch: int = OCR_MAX_BATCH,
+        window_seconds: float = OCR_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        self._workers = workers
+        self._max_batch = max_batch
+        self._window = window_seconds
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Strong references: the loop only keeps weak ones to running tasks
+        self._dispatches: Set[asyncio.Task] = set()
+
+    def _ensure_started(self) -> None:
+        """Start the drain task on first use, or restart it (must run inside the event loop)."""
+        if self._task is not None and not self._task.done():
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        # A restarted drain task picks up whatever is still queued
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn, not fork: the pool starts lazily inside the already-threaded server
+            # process, and a forked child can inherit locks held by other threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_ocr_worker_init,
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for task in self._dispatches:
+            task.cancel()
+        self._dispatches.clear()
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+            self._queue = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def extract_text(self, file_path: str) -> str:
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((file_path, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without waiting so the next batch can start coalescing
+            task = loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch) -> None:
+        loop = asyncio.get_running_loop()
+        if ocr_backends.available():
+            # Deep-learning OCR (OCR_BACKEND) runs on a thread here: one model for the
+            # server instead of one per worker process, and inference is serialised anyway
+            slices = [batch]
+            results = await asyncio.gather(
+                asyncio.to_thread(_extract_batch, [path for path, _ in batch]), return_exceptions=True
+            )
+        else:
+            n_slices = min(self._workers, len(batch))
+            slices = [batch[i::n_slices] for i in range(n_slices)]
+            pool = self._get_pool()
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, _extract_batch, [path for path, _ in part])
+                    for part in slices
+                ),
+                return_exceptions=True,
+            )
+            if any(isinstance(outcome, BrokenProcessPool) for outcome in results) and self._pool is pool:
+                # A worker died (OOM, crash in native OCR code); start a fresh pool for later batches
+                logger.warning("OCR process pool broke; restarting it")
+                pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+        for part, outcome in zip(slices, results):
+            if isinstance(outcome, BaseException):
+                logger.warning("OCR batch of %d file(s) failed: %s", len(part), outcome)
+                for _, future in part:
+                    if not future.done():
+                        future.set_exception(outcome)
+                continue
+            for (_, future), (text, error) in zip(part, outcome):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(text)
+
+
+ocr_batcher = OcrBatcher()
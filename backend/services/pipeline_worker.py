@@ -1,27 +1,45 @@
+import hashlib
 import logging
+import queue
 import re
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
-from pymongo import ReturnDocument
-from pymongo.errors import PyMongoError
+import numpy as np
+from pymongo import DeleteMany, InsertOne, ReturnDocument
+from bson import Binary
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
 
-from backend.ai.embeddings import get_embedding
+from backend.ai.embeddings import EMBEDDING_MODEL, embedding_model_name, get_embeddings, quantize_int8
 from backend.ai.predictor import predict_case_with_history
 from backend.ai.summarizer import make_basic_summary, summarize_structured
-from backend.ai.text_pipeline import detect_language_code, normalize_text, split_paragraphs
+from backend.ai.text_pipeline import count_tokens, detect_language_code, normalize_text, split_paragraphs
 from backend.ai.translator import translate_text
-from backend.ai.vector_store import vector_store
-from backend.database.mongo import connect_to_mongo, get_db
+from backend.ai.vector_store import SNIPPET_CHARS, similarity_index, vector_store
+from backend.database.mongo import bump_corpus_version, connect_to_mongo, get_db
 from backend.database.mysql import get_mysql_connection
+from backend.database.settings import PIPELINE_WORKERS
 from backend.utils.case_extractor import validate_metadata_for_sql
 
 MAX_RETRIES = 3
 WORKER_POLL_SECONDS = 2
+WORKER_POLL_MIN_SECONDS = 0.25   # first idle wait after a job; doubles up to WORKER_POLL_MAX_SECONDS
+WORKER_POLL_MAX_SECONDS = 8
+WORKER_WATCH_AWAIT_MS = 1000     # change-stream getMore wait; bounds how long stop() waits on the watcher
 WORKER_DB_RETRY_SECONDS = 5
 WORKER_ID = "local-pipeline-worker"
+EMBED_BATCH_SIZE = 32
+
+# Shared pool for independent side work inside a stage (the similarity search
+# overlapping the snippet embedding, a stage's independent Mongo/MySQL writes).
+_SIDE_EXECUTOR = ThreadPoolExecutor(max_workers=PIPELINE_WORKERS * 4, thread_name_prefix="pipeline-side")
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,20 +54,39 @@ def _clean_text(text: str) -> str:
 def _first_line_title(text: str) -> str:
     if not text:
         return "Untitled Case"
-    return text.split(".")[0][:150].strip() or "Untitled Case"
+    end = text.find(".", 0, 150)     # only the first sentence matters; don't split the whole judgment
+    return (text[:end] if end != -1 else text[:150]).strip() or "Untitled Case"
+
+
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
 
 
-def _extract_facts(clean_text: str) -> List[str]:
-    sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", clean_text) if s.strip()]
-    return sentences[:5]
+def _extract_facts(clean_text: str, limit: int = 5) -> List[str]:
+    """First `limit` sentences; stops scanning once they are found instead of splitting the whole text."""
+    sentences: List[str] = []
+    start = 0
+    for m in _SENTENCE_BREAK_RE.finditer(clean_text):
+        sentence = clean_text[start:m.start()].strip()
+        if sentence:
+            sentences.append(sentence)
+            if len(sentences) == limit:
+                return sentences
+        start = m.end()
+    tail = clean_text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+
+_UNKNOWN_VALUES = frozenset(("", "unknown"))
 
 
 def _v(val):
     """Return None if val is falsy or 'unknown', else the stripped string."""
     if val is None:
         return None
-    s = str(val).strip()
-    return None if (not s or s.lower() == "unknown") else s
+    s = val.strip() if isinstance(val, str) else str(val).strip()
+    return None if s.lower() in _UNKNOWN_VALUES else s
 
 
 def _key_points_to_lines(key_points: List[Any]) -> List[str]:
@@ -71,67 +108,174 @@ def _key_points_to_lines(key_points: List[Any]) -> List[str]:
     return lines
 
 
+def _batched(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def _chunk_text(text: str, chunk_size: int = 180, overlap: int = 40) -> List[str]:
     words = text.split()
     if not words:
         return []
-    chunks: List[str] = []
+    # Single split, then windows are C-level joins over list slices; words
+    # carry no whitespace, so chunks need no strip or emptiness check.
     step = max(1, chunk_size - overlap)
-    for start in range(0, len(words), step):
-        end = min(start + chunk_size, len(words))
-        chunk = " ".join(words[start:end]).strip()
-        if chunk:
-            chunks.append(chunk)
-        if end >= len(words):
-            break
-    return chunks
+    windows = -(-max(0, len(words) - chunk_size) // step) + 1   # until one window reaches the end
+    return [" ".join(words[i * step:i * step + chunk_size]) for i in range(windows)]
 
 
-def _mysql_execute(query: str, params: tuple = (), fetchone: bool = False, fetchall: bool = False):
-    conn = None
-    cursor = None
+_UPSERT_CASE_SQL = """
+    INSERT INTO cases (
+        case_number, case_prefix, case_number_numeric, case_year,
+        title, court_name, court_level, bench,
+        case_type, filing_date, registration_date, decision_date,
+        petitioner, respondent, judge_names, advocates,
+        disposition, citation, source
+    )
+    VALUES (%s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        case_prefix        = COALESCE(VALUES(case_prefix),        case_prefix),
+        case_number_numeric= COALESCE(VALUES(case_number_numeric),case_number_numeric),
+        case_year          = COALESCE(VALUES(case_year),          case_year),
+        title             = VALUES(title),
+        court_name        = COALESCE(VALUES(court_name),       court_name),
+        court_level       = COALESCE(VALUES(court_level),       court_level),
+        bench             = COALESCE(VALUES(bench),             bench),
+        case_type         = COALESCE(VALUES(case_type),         case_type),
+        filing_date       = COALESCE(VALUES(filing_date),       filing_date),
+        registration_date = COALESCE(VALUES(registration_date), registration_date),
+        decision_date     = COALESCE(VALUES(decision_date),     decision_date),
+        petitioner        = COALESCE(VALUES(petitioner),        petitioner),
+        respondent        = COALESCE(VALUES(respondent),        respondent),
+        judge_names       = COALESCE(VALUES(judge_names),       judge_names),
+        advocates         = COALESCE(VALUES(advocates),         advocates),
+        disposition       = COALESCE(VALUES(disposition),       disposition),
+        citation          = COALESCE(VALUES(citation),          citation)
+"""
+
+# Statements run on a server-side prepared cursor: parsed and planned once per
+# pooled connection instead of on every call.
+_PREPARED_SQL = frozenset((_UPSERT_CASE_SQL,))
+
+
+@contextmanager
+def _mysql_tx(prepared: bool = False):
+    """Yield a cursor on one pooled connection; commit on success, roll back on error."""
+    conn = get_mysql_connection()
+    cursor = conn.cursor(prepared=prepared)
     try:
-        conn = get_mysql_connection()
-        cursor = conn.cursor()
+        yield cursor
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def _mysql_execute(query: str, params: tuple = (), fetchone: bool = False, fetchall: bool = False):
+    with _mysql_tx(prepared=query in _PREPARED_SQL) as cursor:
         cursor.execute(query, params)
         row = cursor.fetchone() if fetchone else None
         rows = cursor.fetchall() if fetchall else None
-        conn.commit()
-        if fetchone:
-            return row
-        if fetchall:
-            return rows
-        return None
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    if fetchone:
+        return row
+    if fetchall:
+        return rows
+    return None
+
+
+_SYSTEM_LOG_INSERT = """
+    INSERT INTO system_logs (module, action, details)
+    VALUES (%s, %s, %s)
+"""
+_LOG_FLUSH_SECONDS = 0.2
+_LOG_BATCH_SIZE = 500
+_log_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=10000)
+_log_flusher: Optional[threading.Thread] = None
+_log_flusher_lock = threading.Lock()
+
+
+def _flush_system_logs() -> int:
+    """Write up to _LOG_BATCH_SIZE queued log rows in one executemany; returns the row count."""
+    batch = []
+    while len(batch) < _LOG_BATCH_SIZE:
+        try:
+            batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        try:
+            with _mysql_tx() as cursor:
+                cursor.executemany(_SYSTEM_LOG_INSERT, batch)
+        except Exception:
+            pass
+    return len(batch)
+
+
+def _log_flusher_loop() -> None:
+    while True:
+        time.sleep(_LOG_FLUSH_SECONDS)
+        while _flush_system_logs() == _LOG_BATCH_SIZE:
+            pass
+
+
+def _ensure_log_flusher() -> None:
+    global _log_flusher
+    if _log_flusher is not None:
+        return
+    with _log_flusher_lock:
+        if _log_flusher is None:
+            _log_flusher = threading.Thread(target=_log_flusher_loop, name="system-log-flusher", daemon=True)
+            _log_flusher.start()
 
 
 def _log_system(module: str, action: str, details: str) -> None:
+    """Queue a system_logs row; a background thread batches the inserts. Dropped if the queue is full."""
+    _ensure_log_flusher()
     try:
-        _mysql_execute(
-            """
-            INSERT INTO system_logs (module, action, details)
-            VALUES (%s, %s, %s)
-            """,
-            (module, action, details[:5000]),
-        )
-    except Exception:
+        _log_queue.put_nowait((module, action, details[:5000]))
+    except queue.Full:
         pass
 
 
+_CASE_ID_CACHE_SIZE = 4096
+_case_id_cache: "OrderedDict[str, int]" = OrderedDict()
+_case_id_cache_lock = threading.Lock()
+
+
 def _get_case_id_mysql(case_number: str) -> Optional[int]:
+    """
+    cases.case_id for case_number. Found ids are memoized (a case's id never
+    changes once inserted); misses and errors are not, so a later upsert is seen.
+    """
+    with _case_id_cache_lock:
+        if case_number in _case_id_cache:
+            _case_id_cache.move_to_end(case_number)
+            return _case_id_cache[case_number]
     try:
         row = _mysql_execute(
             "SELECT case_id FROM cases WHERE case_number=%s",
             (case_number,),
             fetchone=True,
         )
-        return int(row[0]) if row else None
     except Exception:
         return None
+    if not row:
+        return None
+    case_id_mysql = int(row[0])
+    with _case_id_cache_lock:
+        _case_id_cache[case_number] = case_id_mysql
+        while len(_case_id_cache) > _CASE_ID_CACHE_SIZE:
+            _case_id_cache.popitem(last=False)
+    return case_id_mysql
 
 
 def _upsert_case_mysql(case_number: str, title: str, clean_text: str, meta: Optional[Dict] = None) -> Optional[int]:
@@ -157,34 +301,7 @@ def _upsert_case_mysql(case_number: str, title: str, clean_text: str, meta: Opti
 
     try:
         _mysql_execute(
-            """
-            INSERT INTO cases (
-                case_number, case_prefix, case_number_numeric, case_year,
-                title, court_name, court_level, bench,
-                case_type, filing_date, registration_date, decision_date,
-                petitioner, respondent, judge_names, advocates,
-                disposition, citation, source
-            )
-            VALUES (%s, %s, %s, %s,  %s, %s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s, %s,  %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-                case_prefix        = COALESCE(VALUES(case_prefix),        case_prefix),
-                case_number_numeric= COALESCE(VALUES(case_number_numeric),case_number_numeric),
-                case_year          = COALESCE(VALUES(case_year),          case_year),
-                title             = VALUES(title),
-                court_name        = COALESCE(VALUES(court_name),       court_name),
-                court_level       = COALESCE(VALUES(court_level),       court_level),
-                bench             = COALESCE(VALUES(bench),             bench),
-                case_type         = COALESCE(VALUES(case_type),         case_type),
-                filing_date       = COALESCE(VALUES(filing_date),       filing_date),
-                registration_date = COALESCE(VALUES(registration_date), registration_date),
-                decision_date     = COALESCE(VALUES(decision_date),     decision_date),
-                petitioner        = COALESCE(VALUES(petitioner),        petitioner),
-                respondent        = COALESCE(VALUES(respondent),        respondent),
-                judge_names       = COALESCE(VALUES(judge_names),       judge_names),
-                advocates         = COALESCE(VALUES(advocates),         advocates),
-                disposition       = COALESCE(VALUES(disposition),       disposition),
-                citation          = COALESCE(VALUES(citation),          citation)
-            """,
+            _UPSERT_CASE_SQL,
             (
                 case_number,
                 _v(meta.get("case_prefix")),
@@ -213,49 +330,62 @@ def _upsert_case_mysql(case_number: str, title: str, clean_text: str, meta: Opti
         return None
 
 
-def _insert_fact_rows(case_id_mysql: int, facts: List[str]) -> None:
-    if not facts:
-        return
-    for idx, fact in enumerate(facts, start=1):
-        _mysql_execute(
-            """
-            INSERT INTO case_facts (case_id, fact_type, fact_text)
-            VALUES (%s, %s, %s)
-            """,
-            (case_id_mysql, f"fact_{idx}", fact),
-        )
+def _replace_fact_rows(case_id_mysql: int, facts: List[str]) -> None:
+    with _mysql_tx() as cursor:
+        cursor.execute("DELETE FROM case_facts WHERE case_id=%s", (case_id_mysql,))
+        if facts:
+            cursor.executemany(
+                """
+                INSERT INTO case_facts (case_id, fact_type, fact_text)
+                VALUES (%s, %s, %s)
+                """,
+                [(case_id_mysql, f"fact_{idx}", fact) for idx, fact in enumerate(facts, start=1)],
+            )
 
 
 def _upsert_summary(case_id_mysql: int, summary_text: str) -> None:
-    _mysql_execute("DELETE FROM case_summaries WHERE case_id=%s", (case_id_mysql,))
     _mysql_execute(
         """
         INSERT INTO case_summaries (case_id, summary_type, summary_text, model_used)
         VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            summary_type = VALUES(summary_type),
+            summary_text = VALUES(summary_text),
+            model_used   = VALUES(model_used),
+            created_at   = CURRENT_TIMESTAMP
         """,
         (case_id_mysql, "judgment", summary_text, "bart-large-cnn-or-fallback"),
     )
 
 
 def _upsert_translation(case_id_mysql: int, language_code: str, translated_summary: str, model_used: str) -> None:
-    _mysql_execute("DELETE FROM case_translations WHERE case_id=%s", (case_id_mysql,))
     _mysql_execute(
         """
         INSERT INTO case_translations (case_id, language_code, translated_summary, model_used)
         VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            translated_summary = VALUES(translated_summary),
+            model_used         = VALUES(model_used),
+            created_at         = CURRENT_TIMESTAMP
         """,
         (case_id_mysql, language_code, translated_summary, model_used),
     )
 
 
 def _upsert_prediction(case_id_mysql: int, result: Dict[str, Any]) -> None:
-    _mysql_execute("DELETE FROM case_predictions WHERE case_id=%s", (case_id_mysql,))
     _mysql_execute(
         """
         INSERT INTO case_predictions (
             case_id, predicted_outcome, win_probability, confidence_score, key_factors, model_version
         )
         VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            predicted_outcome = VALUES(predicted_outcome),
+            win_probability   = VALUES(win_probability),
+            confidence_score  = VALUES(confidence_score),
+            key_factors       = VALUES(key_factors),
+            model_version     = VALUES(model_version),
+            created_at        = CURRENT_TIMESTAMP
         """,
         (
             case_id_mysql,
@@ -269,44 +399,135 @@ def _upsert_prediction(case_id_mysql: int, result: Dict[str, Any]) -> None:
 
 
 def _replace_similar_cases(source_case_id: int, similar_case_numbers: List[str]) -> None:
-    _mysql_execute("DELETE FROM similar_cases WHERE case_id=%s", (source_case_id,))
-    for scn in similar_case_numbers:
-        target_case_id = _get_case_id_mysql(scn)
-        if target_case_id and target_case_id != source_case_id:
-            _mysql_execute(
+    with _mysql_tx() as cursor:
+        target_ids = []
+        if similar_case_numbers:
+            # One IN lookup instead of a _get_case_id_mysql round-trip per case
+            placeholders = ",".join(["%s"] * len(similar_case_numbers))
+            cursor.execute(
+                f"SELECT case_number, case_id FROM cases WHERE case_number IN ({placeholders})",
+                tuple(similar_case_numbers),
+            )
+            ids = {case_number: int(case_id) for case_number, case_id in cursor.fetchall()}
+            for scn in similar_case_numbers:
+                target_case_id = ids.get(scn)
+                if target_case_id and target_case_id != source_case_id:
+                    target_ids.append(target_case_id)
+        cursor.execute("DELETE FROM similar_cases WHERE case_id=%s", (source_case_id,))
+        if target_ids:
+            cursor.executemany(
                 """
                 INSERT INTO similar_cases (case_id, similar_case_id, similarity_score)
                 VALUES (%s, %s, %s)
                 """,
-                (source_case_id, target_case_id, 0.7),
+                [(source_case_id, target_case_id, 0.7) for target_case_id in target_ids],
             )
 
 
-def _insert_ai_output(case_id: Any, case_number: str, stage: str, payload: Dict[str, Any]) -> None:
-    db = get_db()
-    db["ai_outputs"].insert_one(
-        {
-            "case_id": case_id,
-            "case_number": case_number,
-            "stage": stage,
-            "output": payload,
-            "created_at": _utcnow(),
-        }
+def _embed_with_cache(db, texts: List[str]) -> List[Optional[np.ndarray]]:
+    """
+    get_embeddings() behind the embedding_cache collection, keyed by
+    sha1(text) + model name. Only cache misses reach the model; fresh
+    vectors are written back as float32 bytes.
+    """
+    model = embedding_model_name()
+    hashes = [hashlib.sha1(t.encode("utf-8")).hexdigest() if t and t.strip() else None for t in texts]
+    wanted = list({h for h in hashes if h})
+    cached: Dict[str, np.ndarray] = {}
+    if wanted:
+        for doc in db["embedding_cache"].find({"model": model, "hash": {"$in": wanted}}, {"hash": 1, "vector": 1}):
+            cached[doc["hash"]] = np.frombuffer(doc["vector"], dtype=np.float32)
+
+    misses: Dict[str, str] = {}
+    for text, h in zip(texts, hashes):
+        if h and h not in cached:
+            misses.setdefault(h, text)
+    if misses:
+        fresh = get_embeddings(list(misses.values()))
+        docs = []
+        for h, vector in zip(misses, fresh):
+            if vector is None:
+                continue
+            vec = np.asarray(vector, dtype=np.float32)
+            cached[h] = vec
+            docs.append({"hash": h, "model": model, "vector": Binary(vec.tobytes()), "created_at": _utcnow()})
+        if docs:
+            try:
+                db["embedding_cache"].insert_many(docs, ordered=False)
+            except BulkWriteError:
+                pass  # another worker cached the same text first
+    return [cached.get(h) if h else None for h in hashes]
+
+
+def _run_concurrently(calls: List[Callable[[], Any]]) -> None:
+    """Run independent I/O calls on the side pool; waits for all, then re-raises the first failure."""
+    futures = [_SIDE_EXECUTOR.submit(call) for call in calls]
+    wait(futures)
+    for future in futures:
+        future.result()
+
+
+def _insert_ai_output(
+    case_id: Any, case_number: str, stage: str, payload: Dict[str, Any], now: Optional[datetime] = None
+) -> None:
+    _insert_ai_outputs(case_id, case_number, {stage: payload}, now)
+
+
+def _insert_ai_outputs(
+    case_id: Any, case_number: str, outputs: Dict[str, Dict[str, Any]], now: Optional[datetime] = None
+) -> None:
+    """Write several stage outputs for one case in a single insert_many round-trip."""
+    now = now or _utcnow()
+    get_db()["ai_outputs"].insert_many(
+        [
+            {"case_id": case_id, "case_number": case_number, "stage": stage, "output": payload, "created_at": now}
+            for stage, payload in outputs.items()
+        ]
     )
 
 
+# Fields each stage reads from raw_judgments. raw_text / paragraphs are the
+# bulk of a judgment document, so stages that work from clean_text skip them.
+_DEFAULT_PROJECTION = {"case_id_mysql": 1, "judgment_text.clean_text": 1}
+_CLEAN_TEXT_STAGES = {"cleaned", "summarized", "chunked", "embedded"}
+# Stages that read judgment_text.clean_text, which only the extracted stage writes.
+_REQUIRES_CLEAN_TEXT = _CLEAN_TEXT_STAGES | {"translated"}
+_STAGE_PROJECTIONS = {
+    "uploaded": {"_id": 1},
+    "extracted": {"judgment_text.raw_text": 1, "case_metadata": 1},
+    "translated": {"judgment_text.raw_text": 1, "judgment_text.clean_text": 1},
+    "predicted": {"_id": 1},
+    **{stage: _DEFAULT_PROJECTION for stage in _CLEAN_TEXT_STAGES},
+}
+
+
 def _process_stage(job: Dict[str, Any]) -> str:
     db = get_db()
     case_id = job["case_id"]
     case_number = job["case_number"]
     stage = job["stage"]
+    now = _utcnow()     # one timestamp for every write this stage makes
 
-    case_doc = db["raw_judgments"].find_one({"_id": case_id})
+    case_doc = db["raw_judgments"].find_one({"_id": case_id}, _STAGE_PROJECTIONS.get(stage, _DEFAULT_PROJECTION))
     if not case_doc:
         raise RuntimeError("Case not found in raw_judgments")
 
-    raw_text = case_doc.get("judgment_text", {}).get("raw_text", "")
-    clean_text = case_doc.get("judgment_text", {}).get("clean_text", "")
+    judgment_text = case_doc.get("judgment_text", {})
+    raw_text = judgment_text.get("raw_text", "")
+    clean_text = judgment_text.get("clean_text")
+    if stage in _REQUIRES_CLEAN_TEXT and clean_text is None:
+        raise RuntimeError("judgment_text.clean_text missing; the extracted stage has not run")
+
+    # Nothing to analyse (failed OCR, blank upload): finish now instead of running
+    # summarisation, translation, embedding and prediction over an empty string.
+    stage_text = (raw_text or "") if stage == "extracted" else (clean_text or "")
+    if (stage == "extracted" or stage in _REQUIRES_CLEAN_TEXT) and not stage_text.strip():
+        db["raw_judgments"].update_one(
+            {"_id": case_id},
+            {"$set": {"processing_status": "empty", "last_updated_at": now}},
+        )
+        _log_system("pipeline", "empty", case_number)
+        return "completed"
 
     if stage == "uploaded":
         return "extracted"
@@ -316,6 +537,7 @@ def _process_stage(job: Dict[str, Any]) -> str:
         language_code = detect_language_code(normalized)
         paragraphs = split_paragraphs(normalized)
         title = _first_line_title(normalized)
+        token_count = count_tokens(normalized)
 
         # Pull stored metadata (set by upload_routes) to populate SQL fully
         stored_meta = case_doc.get("case_metadata") or {}
@@ -343,19 +565,20 @@ def _process_stage(job: Dict[str, Any]) -> str:
                     "judgment_text.clean_text": normalized,
                     "judgment_text.paragraphs": paragraphs,
                     "judgment_text.language": language_code,
-                    "judgment_text.token_count": len(normalized.split()),
+                    "judgment_text.token_count": token_count,
                     "nlp_flags.text_cleaned": True,
                     "processing_status": "cleaned",
-                    "last_updated_at": _utcnow(),
-                }
+                    "last_updated_at": now,
+                },
+                # clean_text was rewritten, so the cached similarity vector is stale
+                "$unset": {"similarity_embedding": ""},
             },
         )
-        _insert_ai_output(case_id, case_number, "cleaned", {"token_count": len(normalized.split())})
+        _insert_ai_output(case_id, case_number, "cleaned", {"token_count": token_count}, now=now)
         _log_system("pipeline", "cleaned", case_number)
         return "cleaned"
 
     if stage == "cleaned":
-        clean_text = clean_text or _clean_text(raw_text)
         case_id_mysql = case_doc.get("case_id_mysql") or _get_case_id_mysql(case_number)
         facts = _extract_facts(clean_text)
         structured_summary = summarize_structured(clean_text)
@@ -363,31 +586,38 @@ def _process_stage(job: Dict[str, Any]) -> str:
         key_lines = _key_points_to_lines(structured_summary.get("key_points", []))
         summary = "\n".join([f"- {p}" for p in key_lines])
 
-        db["case_facts"].update_one(
-            {"case_id": case_id},
-            {"$set": {"case_id": case_id, "case_number": case_number, "facts": facts, "updated_at": _utcnow()}},
-            upsert=True,
-        )
-        db["case_summaries"].update_one(
-            {"case_id": case_id},
-            {
-                "$set": {
-                    "case_id": case_id,
-                    "case_number": case_number,
-                    "summary": summary,
-                    "short_summary": structured_summary.get("short_summary"),
-                    "basic_summary": basic_summary,              # ← stored for translate route
-                    "detailed_summary": structured_summary.get("detailed_summary"),
-                    "key_points": structured_summary.get("key_points"),
-                    "updated_at": _utcnow(),
-                }
-            },
-            upsert=True,
-        )
+        # These writes touch independent rows/documents; run them together and
+        # only advance processing_status once all of them have landed.
+        writes = [
+            partial(
+                db["case_facts"].update_one,
+                {"case_id": case_id},
+                {"$set": {"case_id": case_id, "case_number": case_number, "facts": facts, "updated_at": now}},
+                upsert=True,
+            ),
+            partial(
+                db["case_summaries"].update_one,
+                {"case_id": case_id},
+                {
+                    "$set": {
+                        "case_id": case_id,
+                        "case_number": case_number,
+                        "summary": summary,
+                        "short_summary": structured_summary.get("short_summary"),
+                        "basic_summary": basic_summary,              # ← stored for translate route
+                        "detailed_summary": structured_summary.get("detailed_summary"),
+                        "key_points": structured_summary.get("key_points"),
+                        "updated_at": now,
+                    }
+                },
+                upsert=True,
+            ),
+            partial(_insert_ai_outputs, case_id, case_number, {"facts": {"facts": facts}, "summary": structured_summary}, now),
+        ]
         if case_id_mysql:
-            _mysql_execute("DELETE FROM case_facts WHERE case_id=%s", (case_id_mysql,))
-            _insert_fact_rows(case_id_mysql, facts)
-            _upsert_summary(case_id_mysql, structured_summary.get("detailed_summary", summary))
+            writes.append(partial(_replace_fact_rows, case_id_mysql, facts))
+            writes.append(partial(_upsert_summary, case_id_mysql, structured_summary.get("detailed_summary", summary)))
+        _run_concurrently(writes)
 
         db["raw_judgments"].update_one(
             {"_id": case_id},
@@ -397,12 +627,10 @@ def _process_stage(job: Dict[str, Any]) -> str:
                     "nlp_flags.entities_extracted": True,
                     "nlp_flags.summarized": True,
                     "processing_status": "summarized",
-                    "last_updated_at": _utcnow(),
+                    "last_updated_at": now,
                 }
             },
         )
-        _insert_ai_output(case_id, case_number, "facts", {"facts": facts})
-        _insert_ai_output(case_id, case_number, "summary", structured_summary)
         _log_system("pipeline", "summarized", case_number)
         return "summarized"
 
@@ -416,7 +644,6 @@ def _process_stage(job: Dict[str, Any]) -> str:
             basic   = stored_sum.get("basic_summary") or stored_sum.get("short_summary") or ""
             kpoints = stored_sum.get("key_points") or []
         else:
-            clean_text = clean_text or _clean_text(raw_text)
             structured_summary = summarize_structured(clean_text)
             basic   = make_basic_summary(clean_text)
             kpoints = structured_summary.get("key_points", [])
@@ -424,7 +651,7 @@ def _process_stage(job: Dict[str, Any]) -> str:
         key_lines     = _key_points_to_lines(kpoints)
         key_str       = "\n".join([f"{i+1}. {p}" for i, p in enumerate(key_lines)])
         translate_src = f"{basic}\n\nKey Points:\n{key_str}".strip() or \
-                        (clean_text or _clean_text(raw_text))[:3000]  # final fallback
+                        clean_text[:3000]  # final fallback
 
         translation = translate_text(translate_src, target_languages=["hi", "te"])
         if not translation:
@@ -442,7 +669,7 @@ def _process_stage(job: Dict[str, Any]) -> str:
                     "case_id": case_id,
                     "case_number": case_number,
                     "translation": translation,
-                    "updated_at": _utcnow(),
+                    "updated_at": now,
                 }
             },
             upsert=True,
@@ -452,7 +679,7 @@ def _process_stage(job: Dict[str, Any]) -> str:
 
         db["raw_judgments"].update_one(
             {"_id": case_id},
-            {"$set": {"nlp_flags.translated": True, "processing_status": "translated", "last_updated_at": _utcnow()}},
+            {"$set": {"nlp_flags.translated": True, "processing_status": "translated", "last_updated_at": now}},
         )
         _insert_ai_output(
             case_id,
@@ -462,16 +689,15 @@ def _process_stage(job: Dict[str, Any]) -> str:
                 "languages": list(translation.keys()),
                 "model_used": {k: v.get("model_used") for k, v in translation.items()},
             },
+            now=now,
         )
         _log_system("pipeline", "translated", case_number)
         return "translated"
 
     if stage == "translated":
-        clean_text = clean_text or _clean_text(raw_text)
         chunks = _chunk_text(clean_text)
         header_lines = [line.strip() for line in (raw_text or "").splitlines()[:40] if line.strip()]
         header_text = "\n".join(header_lines)[:1800]
-        db["case_chunks"].delete_many({"case_id": case_id})
         chunk_docs = []
         if header_text:
             chunk_docs.append(
@@ -481,7 +707,7 @@ def _process_stage(job: Dict[str, Any]) -> str:
                     "chunk_index": -1,
                     "chunk_type": "header",
                     "text": header_text,
-                    "created_at": _utcnow(),
+                    "created_at": now,
                 }
             )
         for idx, chunk in enumerate(chunks):
@@ -492,11 +718,14 @@ def _process_stage(job: Dict[str, Any]) -> str:
                     "chunk_index": idx,
                     "chunk_type": "body",
                     "text": chunk,
-                    "created_at": _utcnow(),
+                    "created_at": now,
                 }
             )
-        if chunk_docs:
-            db["case_chunks"].insert_many(chunk_docs)
+        # Replace the case's chunks in one ordered round-trip (delete runs first)
+        db["case_chunks"].bulk_write(
+            [DeleteMany({"case_id": case_id}), *(InsertOne(doc) for doc in chunk_docs)],
+            ordered=True,
+        )
         db["raw_judgments"].update_one(
             {"_id": case_id},
             {
@@ -504,43 +733,78 @@ def _process_stage(job: Dict[str, Any]) -> str:
                     "chunking.chunk_count": len(chunks),
                     "chunking.chunk_size": 180,
                     "chunking.overlap": 40,
-                    "chunking.last_chunked_at": _utcnow(),
+                    "chunking.last_chunked_at": now,
                     "nlp_flags.chunks_created": True,
                     "processing_status": "chunked",
-                    "last_updated_at": _utcnow(),
+                    "last_updated_at": now,
                 }
             },
         )
-        _insert_ai_output(case_id, case_number, "chunks", {"chunk_count": len(chunks)})
+        _insert_ai_output(case_id, case_number, "chunks", {"chunk_count": len(chunks)}, now=now)
         _log_system("pipeline", "chunked", case_number)
         return "chunked"
 
     if stage == "chunked":
         case_id_mysql = case_doc.get("case_id_mysql") or _get_case_id_mysql(case_number)
-        chunks = list(db["case_chunks"].find({"case_id": case_id}).sort("chunk_index", 1))
         db["embeddings_metadata"].delete_many({"case_id": case_id})
-        embedded_count = 0
 
-        for chunk in chunks:
-            text = chunk.get("text", "")
-            vector = get_embedding(text)
-            if vector is None:
+        # Stream chunks from the cursor in EMBED_BATCH_SIZE batches so peak memory
+        # tracks one batch, not the whole judgment; re-runs hit the embedding cache.
+        cursor = (
+            db["case_chunks"]
+            .find({"case_id": case_id}, {"text": 1, "chunk_index": 1})
+            .sort("chunk_index", 1)
+            .batch_size(EMBED_BATCH_SIZE)
+        )
+        embedded_count = 0
+        vector_sum = None
+        for batch in _batched(cursor, EMBED_BATCH_SIZE):
+            vectors = _embed_with_cache(db, [c.get("text", "") for c in batch])
+            embedded = [(c, v) for c, v in zip(batch, vectors) if v is not None]
+            if not embedded:
                 continue
-            vector_store.add_case(case_number, text)
-            db["embeddings_metadata"].insert_one(
-                {
-                    "case_id": case_id,
-                    "case_number": case_number,
-                    "chunk_index": chunk.get("chunk_index", 0),
-                    "model": "all-MiniLM-L6-v2",
-                    "dimension": int(len(vector)),
-                    "created_at": _utcnow(),
-                }
+            stacked = np.asarray([v for _, v in embedded], dtype=np.float32)
+            vector_store.add_embeddings(case_number, stacked)
+            db["embeddings_metadata"].insert_many(
+                [
+                    {
+                        "case_id": case_id,
+                        "case_number": case_number,
+                        "chunk_index": c.get("chunk_index", 0),
+                        "model": EMBEDDING_MODEL,
+                        "dimension": int(stacked.shape[1]),
+                        "created_at": now,
+                    }
+                    for c, _ in embedded
+                ]
             )
-            embedded_count += 1
-
-        similar = vector_store.search(clean_text or raw_text, k=5)
-        similar_filtered = [x for x in similar if x != case_number][:5]
+            embedded_count += len(embedded)
+            batch_sum = stacked.sum(axis=0)
+            vector_sum = batch_sum if vector_sum is None else vector_sum + batch_sum
+
+        # Query with the normalised mean of the chunk vectors just computed rather
+        # than embedding the document again. The case's own chunks are in the
+        # index too, so over-fetch by that many and de-duplicate. The search runs
+        # on the side pool while this thread embeds the case snippet.
+        search_future = None
+        if embedded_count:
+            query_vec = vector_sum / embedded_count
+            norm = float(np.linalg.norm(query_vec))
+            if norm > 0:
+                query_vec /= norm
+            search_future = _SIDE_EXECUTOR.submit(vector_store.search_by_vector, query_vec, embedded_count + 5)
+
+        # Case-level snippet embedding used by /search similarity ranking
+        similarity_embedding = None
+        snippet_vector = _embed_with_cache(db, [clean_text[:SNIPPET_CHARS]])[0]
+        if snippet_vector is not None:
+            q8, scale = quantize_int8(snippet_vector)
+            similarity_embedding = {"q8": q8, "scale": scale, "dim": len(q8), "model": embedding_model_name()}
+            similarity_index.add_many([(case_number, np.frombuffer(q8, dtype=np.int8))])
+
+        similar_filtered = []
+        if search_future is not None:
+            similar_filtered = [x for x in dict.fromkeys(search_future.result()) if x != case_number][:5]
         if case_id_mysql:
             _replace_similar_cases(case_id_mysql, similar_filtered)
 
@@ -548,63 +812,69 @@ def _process_stage(job: Dict[str, Any]) -> str:
             {"_id": case_id},
             {
                 "$set": {
-                    "embedding.embedding_model": "all-MiniLM-L6-v2",
+                    "embedding.embedding_model": EMBEDDING_MODEL,
                     "embedding.vector_dimension": 384,
                     "embedding.stored_in_vector_db": embedded_count > 0,
-                    "embedding.embedded_at": _utcnow(),
+                    "embedding.embedded_at": now,
+                    "similarity_embedding": similarity_embedding,
                     "nlp_flags.embedded": True,
                     "processing_status": "embedded",
-                    "last_updated_at": _utcnow(),
+                    "last_updated_at": now,
                 }
             },
         )
+        # New case is now searchable by embedding — cached similar-case results are stale
+        bump_corpus_version()
         _insert_ai_output(
-            case_id, case_number, "embeddings", {"embedded_chunks": embedded_count, "similar_cases": similar_filtered}
+            case_id, case_number, "embeddings", {"embedded_chunks": embedded_count, "similar_cases": similar_filtered}, now=now
         )
         _log_system("pipeline", "embedded", case_number)
         return "embedded"
 
     if stage == "embedded":
-        clean_text = clean_text or _clean_text(raw_text)
         case_id_mysql = case_doc.get("case_id_mysql") or _get_case_id_mysql(case_number)
         prediction = predict_case_with_history(clean_text)
+        writes = [
+            partial(
+                db["case_predictions"].update_one,
+                {"case_id": case_id},
+                {
+                    "$set": {
+                        "case_id": case_id,
+                        "case_number": case_number,
+                        "prediction": prediction.get("prediction"),
+                        "confidence": prediction.get("confidence"),
+                        "updated_at": now,
+                    }
+                },
+                upsert=True,
+            ),
+            partial(_insert_ai_output, case_id, case_number, "prediction", prediction, now),
+        ]
         if case_id_mysql:
-            _upsert_prediction(case_id_mysql, prediction)
+            writes.append(partial(_upsert_prediction, case_id_mysql, prediction))
+        _run_concurrently(writes)
 
-        db["case_predictions"].update_one(
-            {"case_id": case_id},
-            {
-                "$set": {
-                    "case_id": case_id,
-                    "case_number": case_number,
-                    "prediction": prediction.get("prediction"),
-                    "confidence": prediction.get("confidence"),
-                    "updated_at": _utcnow(),
-                }
-            },
-            upsert=True,
-        )
         db["raw_judgments"].update_one(
             {"_id": case_id},
             {
                 "$set": {
                     "prediction.predicted_outcome": prediction.get("prediction"),
                     "prediction.confidence_score": prediction.get("confidence"),
-                    "prediction.predicted_at": _utcnow(),
+                    "prediction.predicted_at": now,
                     "nlp_flags.prediction_done": True,
                     "processing_status": "predicted",
-                    "last_updated_at": _utcnow(),
+                    "last_updated_at": now,
                 }
             },
         )
-        _insert_ai_output(case_id, case_number, "prediction", prediction)
         _log_system("pipeline", "predicted", case_number)
         return "predicted"
 
     if stage == "predicted":
         db["raw_judgments"].update_one(
             {"_id": case_id},
-            {"$set": {"processing_status": "completed", "last_updated_at": _utcnow()}},
+            {"$set": {"processing_status": "completed", "last_updated_at": now}},
         )
         _log_system("pipeline", "completed", case_number)
         return "completed"
@@ -697,28 +967,58 @@ def process_next_job() -> bool:
 
 
 class PipelineWorker:
-    def __init__(self) -> None:
+    """
+    PIPELINE_WORKERS threads each run the claim/process loop. Claims are an
+    atomic find_one_and_update, so no two threads ever process the same job;
+    stage work is mostly Mongo/MySQL/HTTP/model I/O that releases the GIL.
+
+    Idle threads are woken by a change stream on processing_queue when one is
+    available (replica set / Atlas); on a standalone mongod they fall back to
+    polling with backoff.
+    """
+
+    def __init__(self, workers: int = PIPELINE_WORKERS) -> None:
+        self._workers = workers
         self._stop_event = threading.Event()
-        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._threads: List[threading.Thread] = []
 
     def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+        if any(thread.is_alive() for thread in self._threads):
             return
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._loop, name="pipeline-worker", daemon=True)
-        self._thread.start()
+        self._threads = [
+            threading.Thread(target=self._loop, name=f"pipeline-worker-{i}", daemon=True)
+            for i in range(self._workers)
+        ]
+        self._threads.append(threading.Thread(target=self._watch_queue, name="pipeline-queue-watch", daemon=True))
+        for thread in self._threads:
+            thread.start()
 
     def stop(self) -> None:
         self._stop_event.set()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=5)
+        self._wake.set()
+        for thread in self._threads:
+            if thread.is_alive():
+                thread.join(timeout=5)
+        while _flush_system_logs():
+            pass
 
     def _loop(self) -> None:
+        idle_wait = WORKER_POLL_MIN_SECONDS
         while not self._stop_event.is_set():
             try:
                 processed = process_next_job()
-                if not processed:
-                    time.sleep(WORKER_POLL_SECONDS)
+                if processed:
+                    idle_wait = WORKER_POLL_MIN_SECONDS
+                else:
+                    # Back off while the queue stays empty: quick pickup right after
+                    # a burst, few no-op claims when idle. A queue event cuts the wait short.
+                    if self._wake.wait(idle_wait):
+                        self._wake.clear()
+                        idle_wait = WORKER_POLL_MIN_SECONDS
+                    else:
+                        idle_wait = min(idle_wait * 2, WORKER_POLL_MAX_SECONDS)
             except PyMongoError as exc:
                 logger.warning(
                     "Pipeline worker lost MongoDB connectivity (%s). Retrying in %ss.",
@@ -731,5 +1031,33 @@ class PipelineWorker:
                 logger.exception("Pipeline worker loop error: %s", exc)
                 time.sleep(WORKER_POLL_SECONDS)
 
+    def _watch_queue(self) -> None:
+        """Wake idle workers when a job becomes claimable; exits if change streams are unsupported."""
+        pipeline = [
+            {
+                "$match": {
+                    "operationType": {"$in": ["insert", "update", "replace"]},
+                    "fullDocument.status": {"$in": ["pending", "retry"]},
+                }
+            }
+        ]
+        while not self._stop_event.is_set():
+            try:
+                with get_db()["processing_queue"].watch(
+                    pipeline, full_document="updateLookup", max_await_time_ms=WORKER_WATCH_AWAIT_MS
+                ) as stream:
+                    while not self._stop_event.is_set():
+                        if stream.try_next() is not None:
+                            self._wake.set()
+            except OperationFailure as exc:
+                logger.info("processing_queue change stream unavailable (%s); workers will poll.", exc)
+                return
+            except PyMongoError as exc:
+                logger.warning("processing_queue change stream dropped (%s). Retrying in %ss.", exc, WORKER_DB_RETRY_SECONDS)
+                self._stop_event.wait(WORKER_DB_RETRY_SECONDS)
+            except Exception as exc:
+                logger.warning("processing_queue change stream stopped: %s", exc)
+                return
+
 
 pipeline_worker = PipelineWorker()
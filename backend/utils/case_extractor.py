@@ -19,9 +19,16 @@ SQL columns populated:
   disposition, citation, source, pdf_url
 """
 
+import hashlib
 import re
+import string
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from itertools import accumulate, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 CURRENT_YEAR = datetime.now().year
 
@@ -110,6 +117,12 @@ _ADVOCATE_TRIGGERS = [
     "ADV.", "AOR", "AMICUS", "SOLICITOR", "ATTORNEY",
 ]
 
+# One compiled alternation per trigger list: a single regex scan per line
+# instead of one substring scan per trigger. Lines are upper-cased before probing.
+_COURT_LINE_TRIGGER_RE = re.compile("|".join(map(re.escape, _COURT_LINE_TRIGGERS)))
+_JUDGE_TRIGGER_RE = re.compile("|".join(map(re.escape, _JUDGE_TRIGGERS)))
+_ADVOCATE_TRIGGER_RE = re.compile("|".join(re.escape(t.upper()) for t in _ADVOCATE_TRIGGERS))
+
 # Disposition: accepted values per final spec
 _DISPOSITION_WORDS = [
     "PARTLY ALLOWED",      # check compound values FIRST (before single words)
@@ -135,26 +148,28 @@ _DISPOSITION_CANONICAL = {
 # ─── Case number patterns (ordered: most specific first) ─────────────────────
 _CASE_NO_PATTERNS = [
     # FCOP / F.C.O.P
-    r"\bF\.?C\.?O\.?P\.?\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((19|20)\d{2})\b",
+    r"\bF\.?C\.?O\.?P\.?\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((?:19|20)\d{2})\b",
     # O.S. / C.S.
-    r"\b(O\.?S\.?|C\.?S\.?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((19|20)\d{2})\b",
+    r"\b(O\.?S\.?|C\.?S\.?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((?:19|20)\d{2})\b",
     # Crl.A / CRL.A / CRLA
-    r"\b(Crl\.?A\.?|CRL\.?A\.?|CRLA)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((19|20)\d{2})\b",
+    r"\b(Crl\.?A\.?|CRL\.?A\.?|CRLA)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((?:19|20)\d{2})\b",
     # W.P. / WP / CWP / WPC
-    r"\b(C?W\.?P\.?C?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((19|20)\d{2})\b",
+    r"\b(C?W\.?P\.?C?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((?:19|20)\d{2})\b",
     # CWP-11649-2024  (dash-separated)
-    r"\b(CWP|WP|WPC)\s*-\s*(\d{1,6})\s*-\s*((19|20)\d{2})\b",
+    r"\b(CWP|WP|WPC)\s*-\s*(\d{1,6})\s*-\s*((?:19|20)\d{2})\b",
     # C.C. / CC
-    r"\b(C\.?C\.?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((19|20)\d{2})\b",
+    r"\b(C\.?C\.?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((?:19|20)\d{2})\b",
     # M.C. / MC
-    r"\b(M\.?C\.?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((19|20)\d{2})\b",
+    r"\b(M\.?C\.?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((?:19|20)\d{2})\b",
     # B.A. / BA
-    r"\b(B\.?A\.?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((19|20)\d{2})\b",
+    r"\b(B\.?A\.?)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:/|of)\s*((?:19|20)\d{2})\b",
     # FMAT / MAT / SLP / CMA / RFA / RSA / SA / AS / EP / OP / LA / RC / CA / IA / TA / MA
-    r"\b(FMAT|MAT|SLP|CMA|RFA|RSA|SA|AS|EP|OP|O\.P|CP|LA|RC|CA|IA|TA|MA)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:of|/)\s*((19|20)\d{2})\b",
+    r"\b(FMAT|MAT|SLP|CMA|RFA|RSA|SA|AS|EP|OP|O\.P|CP|LA|RC|CA|IA|TA|MA)\s*(?:No\.?)?\s*(\d{1,6})\s*(?:of|/)\s*((?:19|20)\d{2})\b",
     # Generic: CRL / WP / OS uppercase 2-5 letter prefix
-    r"\b([A-Z]{2,5})\s*\.?\s*(?:No\.?|Case)?\s*(\d{1,6})\s*(?:/|of)\s*((19|20)\d{2})\b",
+    r"\b([A-Z]{2,5})\s*\.?\s*(?:No\.?|Case)?\s*(\d{1,6})\s*(?:/|of)\s*((?:19|20)\d{2})\b",
 ]
+_CASE_NO_RES = [re.compile(p, re.IGNORECASE) for p in _CASE_NO_PATTERNS]
+
 
 # ─── Date patterns ────────────────────────────────────────────────────────────
 _DATE_PATTERNS = [
@@ -170,35 +185,64 @@ _MONTH_MAP = {
     "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
 }
 
+# ─── Compiled helper patterns (hot per-document / per-line paths) ─────────────
+_PAGE_NUM_RE = re.compile(r"^[-\s]*(Page\s+)?\d{1,3}[-\s]*$", re.IGNORECASE)
+_HSPACE_RUN_RE = re.compile(r"[ \t]{2,}")
+_SPACE_RUN_RE = re.compile(r"\s{2,}")
+_YEAR_RE = re.compile(r"(19|20)\d{2}")
+_YEAR_ONLY_RE = re.compile(r"(19|20)\d{2}$")
+_CASE_NUMERIC_RE = re.compile(r"\d{1,6}")
+_PRESENT_CORAM_RE = re.compile(r"\bPRESENT\b|\bCORAM\b", re.IGNORECASE)
+_BENCH_RE = re.compile(r"\b(Division\s+Bench|Single\s+Bench|Full\s+Bench|DB|SB|FB)\b", re.IGNORECASE)
+
+_DATE_DMY_RE = re.compile(r"\b(\d{1,2})[./\-](\d{1,2})[./\-]((19|20)\d{2})\b")
+_DATE_D_MON_Y_RE = re.compile(
+    r"\b(\d{1,2})\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[,.\s]+((19|20)\d{2})\b",
+    re.IGNORECASE,
+)
+_DATE_MONTH_D_Y_RE = re.compile(
+    r"\b(january|february|march|april|may|june|july|august|september|october|november|december)"
+    r"\s+(\d{1,2})[,.\s]+((19|20)\d{2})\b",
+    re.IGNORECASE,
+)
+
+_FILING_LABEL_RE = re.compile(
+    r"FILED ON|FILING DATE|DATE OF FILING|PRESENTED ON|PRESENTATION DATE"
+    r"|DATE OF PRESENTATION"
+)
+_REGISTRATION_LABEL_RE = re.compile(r"REGISTRATION DATE|REGISTERED ON")
+_DECISION_LABEL_RE = re.compile(
+    r"DECIDED ON|JUDGMENT ON|JUDGMENT DATE|ORDER DATED|DATED:\s*"
+    r"|PRONOUNCED ON|DATE OF PRONOUNCEMENT|DATE OF DECISION"
+    r"|JUDGEMENT ON|DATE OF JUDGEMENT"
+)
+_HEARD_LABEL_RE = re.compile(r"HEARD ON|HEARING DATE|ARGUED ON")
+# Any of the four label groups: one search rejects the (many) unlabelled lines
+_DATE_LABEL_RE = re.compile("|".join(
+    p.pattern for p in (_FILING_LABEL_RE, _REGISTRATION_LABEL_RE, _DECISION_LABEL_RE, _HEARD_LABEL_RE)
+))
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # INTERNAL HELPERS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _header_lines(text: str, n: int = 60) -> List[str]:
-    """Return first n lines of text (first page only)."""
-    return text.splitlines()[:n]
-
-
-def _prepare_header(text: str, n: int = 60) -> Tuple[List[str], str]:
+def _prepare_header(all_lines: List[str], n: int = 60) -> Tuple[List[str], List[str], str]:
     """
     Stage 1 — Prepare the first-page header for parsing.
 
     Steps:
-      1. Take only the first n lines
+      1. Take only the first n lines of the document (all_lines = text.splitlines())
       2. Remove empty / whitespace-only lines
       3. Remove pure page-number lines (e.g. '1', 'Page 1', '- 1 -')
       4. Normalize whitespace (collapse multiple spaces)
-      5. Return both the cleaned line list AND a single uppercase string for pattern matching
+      5. Return the cleaned line list, its upper-cased twin (computed once here so the
+         zone extractors don't re-upper-case every line) and a single uppercase string
 
     Returns:
-        (cleaned_lines: List[str], upper_text: str)
+        (cleaned_lines: List[str], upper_lines: List[str], upper_text: str)
     """
-    raw_lines = text.splitlines()[:n]
-
-    _PAGE_NUM_RE = re.compile(
-        r"^[-\s]*(Page\s+)?\d{1,3}[-\s]*$", re.IGNORECASE
-    )
+    raw_lines = all_lines[:n]
 
     cleaned: List[str] = []
     for line in raw_lines:
@@ -208,11 +252,12 @@ def _prepare_header(text: str, n: int = 60) -> Tuple[List[str], str]:
         if _PAGE_NUM_RE.match(stripped):        # skip page number lines
             continue
         # Normalize internal whitespace
-        normalized = re.sub(r"[ \t]{2,}", " ", stripped)
+        normalized = _HSPACE_RUN_RE.sub(" ", stripped)
         cleaned.append(normalized)
 
-    upper_text = "\n".join(cleaned).upper()
-    return cleaned, upper_text
+    upper_lines = [line.upper() for line in cleaned]
+    upper_text = "\n".join(upper_lines)
+    return cleaned, upper_lines, upper_text
 
 
 def _validate_year(year_str: str) -> Optional[int]:
@@ -225,24 +270,34 @@ def _validate_year(year_str: str) -> Optional[int]:
     return None
 
 
+# Dot-free CASE_TYPE_MAP key → (position in the map, key), built once
+_CLEAN_CASE_TYPE_KEYS: Dict[str, Tuple[int, str]] = {
+    k.upper().replace(".", ""): (i, k) for i, k in enumerate(CASE_TYPE_MAP)
+}
+
+
 def _normalize_prefix(raw: str) -> str:
+    # First map key (in CASE_TYPE_MAP order) that the cleaned prefix starts with,
+    # found by looking up each leading slice of the prefix instead of scanning the map
     key = raw.upper().replace(" ", "").replace(".", "")
-    for k in CASE_TYPE_MAP:
-        clean_k = k.upper().replace(".", "")
-        if clean_k == key or key.startswith(clean_k):
-            return k
+    hits = [_CLEAN_CASE_TYPE_KEYS[key[:n]] for n in range(1, len(key) + 1) if key[:n] in _CLEAN_CASE_TYPE_KEYS]
+    if hits:
+        return min(hits)[1]
     return raw.upper()
 
 
+_ADVOCATE_CONTEXT_RE = re.compile(
+    r"advocate|counsel|phone|mob|tel|enrolment|bar council|registration no|enrol"
+)
+
+
 def _is_advocate_context(match_str: str, context: str) -> bool:
     """Return True if the match appears after an advocate/phone reference."""
     idx = context.find(match_str)
     if idx < 0:
         return False
     snippet = context[max(0, idx - 100): idx].lower()
-    bad = ["advocate", "counsel", "phone", "mob", "tel", "enrolment", "bar council",
-           "registration no", "enrol"]
-    return any(w in snippet for w in bad)
+    return _ADVOCATE_CONTEXT_RE.search(snippet) is not None
 
 
 
@@ -264,6 +319,11 @@ _PARTY_TRAILING_GARBAGE = re.compile(
     r"\b(and|others?|respondents?|petitioner|appellant|defendant|plaintiff|anr|ors)\b\.?$",
     re.IGNORECASE,
 )
+# str.translate table deleting A–Z/a–z (alpha count for ASCII names in C)
+_DELETE_ASCII_LETTERS = str.maketrans("", "", string.ascii_letters)
+_BRACKETED_RE = re.compile(r"\[[^\]]*\]")
+_ALPHA_WORD_RE = re.compile(r"[A-Za-z]+")
+_ALPHA_2_RE = re.compile(r"[A-Za-z]{2,}")
 
 
 def _clean_party_name(raw: str) -> Optional[str]:
@@ -282,8 +342,8 @@ def _clean_party_name(raw: str) -> Optional[str]:
 
     # Take first line only, strip common punctuation
     name = raw.strip().split("\n")[0].strip(" .:-,|")
-    name = re.sub(r"\s{2,}", " ", name)
-    name = re.sub(r"\[[^\]]*\]", "", name).strip(" .:-,|")
+    name = _SPACE_RUN_RE.sub(" ", name)
+    name = _BRACKETED_RE.sub("", name).strip(" .:-,|")
 
     # Remove frequent trailing legal noise (e.g., "... and", "... respondents")
     for _ in range(2):
@@ -297,7 +357,10 @@ def _clean_party_name(raw: str) -> Optional[str]:
         return None
 
     # Rule: ≥70% alphabetic characters (reject "02.02.2012", "145/2021", etc.)
-    alpha_count = sum(1 for c in name if c.isalpha())
+    if name.isascii():
+        alpha_count = len(name) - len(name.translate(_DELETE_ASCII_LETTERS))
+    else:   # Indic / accented names: keep Unicode-aware isalpha
+        alpha_count = sum(1 for c in name if c.isalpha())
     if alpha_count / max(len(name), 1) < 0.70:
         return None
 
@@ -312,11 +375,11 @@ def _clean_party_name(raw: str) -> Optional[str]:
         return None
 
     # Rule: must contain at least one word of ≥2 letters (not just initials)
-    if not re.search(r"[A-Za-z]{2,}", name):
+    if not _ALPHA_2_RE.search(name):
         return None
 
     # Rule: reject obvious filler-only names (e.g., "the", "private respondents and")
-    words = re.findall(r"[A-Za-z]+", name.lower())
+    words = _ALPHA_WORD_RE.findall(name.lower())
     if not words:
         return None
     if all(w in _PARTY_STOPWORDS for w in words):
@@ -330,16 +393,13 @@ def _clean_party_name(raw: str) -> Optional[str]:
 def _parse_date(text: str) -> Optional[str]:
     """Try to parse a date string into YYYY-MM-DD. Returns None on failure."""
     # DD/MM/YYYY or DD-MM-YYYY
-    m = re.search(r"\b(\d{1,2})[./\-](\d{1,2})[./\-]((19|20)\d{2})\b", text)
+    m = _DATE_DMY_RE.search(text)
     if m:
         d, mo, y = int(m.group(1)), int(m.group(2)), int(m.group(3))
         if 1 <= mo <= 12 and 1 <= d <= 31:
             return f"{y:04d}-{mo:02d}-{d:02d}"
     # DD Mon YYYY
-    m = re.search(
-        r"\b(\d{1,2})\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[,.\s]+((19|20)\d{2})\b",
-        text, re.IGNORECASE
-    )
+    m = _DATE_D_MON_Y_RE.search(text)
     if m:
         d = int(m.group(1))
         mo = _MONTH_MAP.get(m.group(2).lower())
@@ -347,11 +407,7 @@ def _parse_date(text: str) -> Optional[str]:
         if mo and 1 <= d <= 31:
             return f"{y:04d}-{mo:02d}-{d:02d}"
     # Month DD, YYYY
-    m = re.search(
-        r"\b(january|february|march|april|may|june|july|august|september|october|november|december)"
-        r"\s+(\d{1,2})[,.\s]+((19|20)\d{2})\b",
-        text, re.IGNORECASE
-    )
+    m = _DATE_MONTH_D_Y_RE.search(text)
     if m:
         mo = _MONTH_MAP.get(m.group(1).lower())
         d = int(m.group(2))
@@ -365,29 +421,30 @@ def _parse_date(text: str) -> Optional[str]:
 # ZONE EXTRACTORS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _extract_court(lines: List[str]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+def _extract_court(
+    lines: List[str],
+    upper_lines: List[str],
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     TOP ZONE (lines 1–10): Find court name.
+    upper_lines is lines upper-cased (from _prepare_header).
     Returns (court_name, court_level, bench).
     Searches strictly first 10 lines as per spec.
     """
-    search_zone = lines[:10]   # spec: first 10 lines only
     court_name: Optional[str] = None
     court_level: Optional[str] = None
+    up_court = ""
 
-    for i, line in enumerate(search_zone):
-        up = line.strip().upper()
-        if not up:
-            continue
-        if any(trigger in up for trigger in _COURT_LINE_TRIGGERS):
-            court_name = line.strip()
+    for line, up in zip(lines[:10], upper_lines[:10]):   # spec: first 10 lines only
+        if _COURT_LINE_TRIGGER_RE.search(up):
+            court_name = line
+            up_court = up
             break
 
     if not court_name:
         return None, None, None
 
     # Determine level
-    up_court = court_name.upper()
     for keyword, level in _COURT_LEVEL_MAP:
         if keyword in up_court:
             court_level = level
@@ -396,10 +453,7 @@ def _extract_court(lines: List[str]) -> Tuple[Optional[str], Optional[str], Opti
     # Bench: look for "Division Bench" / "Single Bench" / "Full Bench" near top 20 lines
     bench: Optional[str] = None
     bench_zone_text = "\n".join(lines[:20])
-    bm = re.search(
-        r"\b(Division\s+Bench|Single\s+Bench|Full\s+Bench|DB|SB|FB)\b",
-        bench_zone_text, re.IGNORECASE
-    )
+    bm = _BENCH_RE.search(bench_zone_text)
     if bm:
         bench = bm.group(0).strip()
 
@@ -415,28 +469,40 @@ def _extract_case_number(
     Returns (case_number, case_prefix, case_type, case_number_numeric, case_year).
     Skips lines > 120 chars and lines containing PRESENT/CORAM.
     """
-    upper_zone = "\n".join(lines[4:26])   # lines 5–26 (0-indexed 4–25)
-    upper_lines = lines[4:26]
+    upper_lines = lines[4:26]   # lines 5–26 (0-indexed 4–25)
+
+    # Every pattern ends in a 19xx/20xx year, so no match can start below the
+    # last line holding one: trim the zone there, or bail out if there is none.
+    # (Patterns may span lines via \s*, so lines above it are kept intact.)
+    last_year_line = next(
+        (i for i in range(len(upper_lines) - 1, -1, -1) if _YEAR_RE.search(upper_lines[i])), None
+    )
+    if last_year_line is None:
+        return None, None, None, None, None
+    upper_lines = upper_lines[:last_year_line + 1]
+    upper_zone = "\n".join(upper_lines)
+    # Offset of each line's first char in upper_zone, for match → line lookups
+    line_starts = list(accumulate((len(line) + 1 for line in upper_lines[:-1]), initial=0))
 
     candidates = []
-    for pat in _CASE_NO_PATTERNS:
-        for m in re.finditer(pat, upper_zone, re.IGNORECASE):
+    for pat in _CASE_NO_RES:
+        for m in pat.finditer(upper_zone):
             # Find which line this match is on
-            line_offset = upper_zone[:m.start()].count("\n")
+            line_offset = bisect_right(line_starts, m.start()) - 1
             src_line = upper_lines[line_offset] if line_offset < len(upper_lines) else ""
 
             # Reject: line too long
             if len(src_line) > 120:
                 continue
             # Reject: PRESENT / CORAM context
-            if re.search(r"\bPRESENT\b|\bCORAM\b", src_line, re.IGNORECASE):
+            if _PRESENT_CORAM_RE.search(src_line):
                 continue
             # Reject: advocate context
             if _is_advocate_context(m.group(0), upper_zone):
                 continue
 
-            groups = [g for g in m.groups() if g and re.search(r"(19|20)\d{2}", g) is None]
-            year_grp = [g for g in m.groups() if g and re.match(r"(19|20)\d{2}$", g)]
+            groups = [g for g in m.groups() if g and _YEAR_RE.search(g) is None]
+            year_grp = [g for g in m.groups() if g and _YEAR_ONLY_RE.match(g)]
 
             if not year_grp:
                 continue
@@ -452,7 +518,7 @@ def _extract_case_number(
                 continue
 
             number = str(number).strip()
-            if not re.fullmatch(r"\d{1,6}", number):
+            if not _CASE_NUMERIC_RE.fullmatch(number):
                 continue
 
             norm = _normalize_prefix(prefix)
@@ -472,14 +538,32 @@ def _extract_case_number(
     _, cn, case_prefix, case_type, case_number_numeric, case_year = candidates[0]
 
     # Validate: must contain 4-digit year
-    if not re.search(r"(19|20)\d{2}", cn):
+    if not _YEAR_RE.search(cn):
         return None, None, None, None, None
 
     return cn, case_prefix, case_type, case_number_numeric, case_year
 
 
+_PARTIES_INLINE_RE = re.compile(
+    r"([A-Za-z][^\n]{2,100})\s+(?:Versus|Vs\.?|V/[Ss])\s+([A-Za-z][^\n]{2,100})", re.IGNORECASE
+)
+# A line that is exactly VERSUS / VS / VS. / V/S (upper-cased, already stripped)
+_VERSUS_LINES = frozenset({"VERSUS", "VS", "VS.", "V/S"})
+_PARTIES_MULTILINE_RE = re.compile(
+    r"^([^\n]{3,120})\s*\n\s*(?:Vs?\.?|Versus|V/[Ss])\s*\n\s*([^\n]{3,120})$", re.IGNORECASE | re.MULTILINE
+)
+_BETWEEN_AND_RE = re.compile(r"Between[:\s]+(.+?)\s+And[:\s]+(.+?)(?:\n\n|\Z)", re.IGNORECASE | re.DOTALL)
+# "PETITIONER: X" / "RESPONDENT - Y"; lastgroup says which side, m.end() is where the name starts
+_PARTY_LABEL_RE = re.compile(
+    r"^(?:(?P<petitioner>PETITIONER|PLAINTIFF|COMPLAINANT|APPELLANT)"
+    r"|(?P<respondent>RESPONDENT|DEFENDANT|OPPOSITE PARTY|ACCUSED))\s*[:\-]\s*",
+    re.IGNORECASE,
+)
+
+
 def _extract_parties(
     lines: List[str],
+    upper_lines: List[str],
 ) -> Tuple[Optional[str], Optional[str]]:
     """
     MIDDLE ZONE (lines 20–80): Extract petitioner and respondent.
@@ -488,17 +572,15 @@ def _extract_parties(
       2. Petitioner on one line, 'Versus' / 'Vs' / 'V/s' on next, Respondent after
       3. Between / And block
       4. Petitioner / Respondent keyword lines
+    upper_lines is lines upper-cased (from _prepare_header).
     """
-    def _extract_from_zone(zone_lines: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    def _extract_from_zone(zone_lines: List[str], zone_upper: List[str]) -> Tuple[Optional[str], Optional[str]]:
         zone_text = "\n".join(zone_lines)
         petitioner: Optional[str] = None
         respondent: Optional[str] = None
 
         # ── Priority 1: A Versus/V/s/vs B on same line ───────────────────────
-        inline_m = re.search(
-            r"([A-Za-z][^\n]{2,100})\s+(?:Versus|Vs\.?|V/[Ss])\s+([A-Za-z][^\n]{2,100})",
-            zone_text, re.IGNORECASE
-        )
+        inline_m = _PARTIES_INLINE_RE.search(zone_text)
         if inline_m:
             p = _clean_party_name(inline_m.group(1))
             r = _clean_party_name(inline_m.group(2))
@@ -506,9 +588,8 @@ def _extract_parties(
                 return p, r
 
         # ── Priority 2: A \n Versus \n B (across lines) ──────────────────────
-        for i, line in enumerate(zone_lines):
-            up = line.strip().upper()
-            if re.match(r"^(VERSUS|VS\.?|V/S)$", up):
+        for i, up in enumerate(zone_upper):
+            if up in _VERSUS_LINES:
                 if i > 0:
                     petitioner = _clean_party_name(zone_lines[i - 1])
                 if i + 1 < len(zone_lines):
@@ -517,10 +598,7 @@ def _extract_parties(
                     return petitioner, respondent
 
         # ── Priority 3: A\n\nVs.\n\nB (multiline regex) ──────────────────────
-        vs_m = re.search(
-            r"^([^\n]{3,120})\s*\n\s*(?:Vs?\.?|Versus|V/[Ss])\s*\n\s*([^\n]{3,120})$",
-            zone_text, re.IGNORECASE | re.MULTILINE
-        )
+        vs_m = _PARTIES_MULTILINE_RE.search(zone_text)
         if vs_m:
             p = _clean_party_name(vs_m.group(1))
             r = _clean_party_name(vs_m.group(2))
@@ -528,10 +606,7 @@ def _extract_parties(
                 return p, r
 
         # ── Priority 4: Between / And block ───────────────────────────────────
-        btw_m = re.search(
-            r"Between[:\s]+(.+?)\s+And[:\s]+(.+?)(?:\n\n|\Z)",
-            zone_text, re.IGNORECASE | re.DOTALL
-        )
+        btw_m = _BETWEEN_AND_RE.search(zone_text)
         if btw_m:
             petitioner = _clean_party_name(btw_m.group(1))
             respondent = _clean_party_name(btw_m.group(2))
@@ -540,45 +615,48 @@ def _extract_parties(
 
         # ── Priority 5: Keyword lines ─────────────────────────────────────────
         for line in zone_lines:
-            up = line.strip().upper()
-            if re.match(r"^(PETITIONER|PLAINTIFF|COMPLAINANT|APPELLANT)\s*[:\-]", up):
-                raw = re.sub(r"^(PETITIONER|PLAINTIFF|COMPLAINANT|APPELLANT)\s*[:\-]\s*", "", line.strip(), flags=re.IGNORECASE)
-                petitioner = _clean_party_name(raw)
-            elif re.match(r"^(RESPONDENT|DEFENDANT|OPPOSITE PARTY|ACCUSED)\s*[:\-]", up):
-                raw = re.sub(r"^(RESPONDENT|DEFENDANT|OPPOSITE PARTY|ACCUSED)\s*[:\-]\s*", "", line.strip(), flags=re.IGNORECASE)
-                respondent = _clean_party_name(raw)
+            label_m = _PARTY_LABEL_RE.match(line)
+            if not label_m:
+                continue
+            if label_m.lastgroup == "petitioner":
+                petitioner = _clean_party_name(line[label_m.end():])
+            else:
+                respondent = _clean_party_name(line[label_m.end():])
 
         return petitioner, respondent
 
     # Header-first extraction lock: use strict top zone first.
-    header_zone = lines[:40]
-    p, r = _extract_from_zone(header_zone)
+    p, r = _extract_from_zone(lines[:40], upper_lines[:40])
     if p and r:
         return p, r
 
     # Fallback to broader zone only when header extraction is incomplete.
-    p2, r2 = _extract_from_zone(lines[5:80])
+    p2, r2 = _extract_from_zone(lines[5:80], upper_lines[5:80])
     return p or p2, r or r2
 
 
-def _extract_judges(lines: List[str]) -> Optional[str]:
+# Every honorific in one case-insensitive pass (alternatives tried in _SKIP_TITLES order)
+_SKIP_TITLE_RE = re.compile("|".join(re.escape(title) for title in _SKIP_TITLES), re.IGNORECASE)
+
+
+def _extract_judges(lines: List[str], upper_lines: List[str]) -> Optional[str]:
     """
     LOWER ZONE: Find judge name(s) from JUSTICE / CORAM / PRESENT / HON'BLE lines.
+    upper_lines is lines upper-cased (from _prepare_header).
     Returns a comma-joined string of names, or None.
     """
     judge_names: List[str] = []
+    seen = set()
 
-    for i, line in enumerate(lines[:80]):
-        up = line.strip().upper()
-        if not any(trigger in up for trigger in _JUDGE_TRIGGERS):
+    for i, up in enumerate(upper_lines[:80]):
+        if not _JUDGE_TRIGGER_RE.search(up):
             continue
 
         # Try extracting from this line
-        name = line.strip()
-        for title in _SKIP_TITLES:
-            name = re.sub(re.escape(title), "", name, flags=re.IGNORECASE)
+        name = lines[i]
+        name = _SKIP_TITLE_RE.sub("", name)
         name = name.strip(" :-\t,.")
-        name = re.sub(r"\s{2,}", " ", name)
+        name = _SPACE_RUN_RE.sub(" ", name)
 
         # If name is too short, try next line
         if len(name) < 4 and i + 1 < len(lines):
@@ -586,25 +664,30 @@ def _extract_judges(lines: List[str]) -> Optional[str]:
 
         # Must not contain court keywords
         if len(name) >= 4 and "court" not in name.lower() and len(name) <= 150:
-            if name not in judge_names:
+            if name not in seen:
+                seen.add(name)
                 judge_names.append(name)
 
     return ", ".join(judge_names) if judge_names else None
 
 
-def _extract_advocates(text: str) -> Optional[str]:
-    """Extract advocate names from full text. Returns comma-joined string or None."""
+_ADVOCATE_PREFIX_RE = re.compile(
+    r"(Advocate for |Counsel for |Sr\.? Counsel |Senior Counsel |Adv\.|AOR\s+|learned counsel)\s*", re.IGNORECASE
+)
+
+
+def _extract_advocates(all_lines: List[str]) -> Optional[str]:
+    """Extract advocate names from the document's lines. Returns comma-joined string or None."""
     advocates: List[str] = []
-    for line in text.splitlines()[:100]:
+    seen = set()
+    for line in all_lines[:100]:
         up = line.strip().upper()
-        if any(trigger in up for trigger in [t.upper() for t in _ADVOCATE_TRIGGERS]):
+        if _ADVOCATE_TRIGGER_RE.search(up):
             # Extract the name part after the keyword
-            name = re.sub(
-                r"(Advocate for |Counsel for |Sr\.? Counsel |Senior Counsel |Adv\.|AOR\s+|learned counsel)\s*",
-                "", line.strip(), flags=re.IGNORECASE
-            ).strip(" :,-")
-            name = re.sub(r"\s{2,}", " ", name)
-            if 3 < len(name) <= 120 and name not in advocates:
+            name = _ADVOCATE_PREFIX_RE.sub("", line.strip()).strip(" :,-")
+            name = _SPACE_RUN_RE.sub(" ", name)
+            if 3 < len(name) <= 120 and name not in seen:
+                seen.add(name)
                 advocates.append(name)
     return ", ".join(advocates[:6]) if advocates else None
 
@@ -622,22 +705,26 @@ def _extract_disposition(text: str) -> Optional[str]:
     return None
 
 
+_CITATION_REPORTER_RE = re.compile(
+    r"\((?:19|20)\d{2}\)\s+\d+\s+(?:SCC|AIR|SCR|MLJ|ALT|ALR|ALJR|HLR|BLR|CLR)\s+\d+",
+    re.IGNORECASE,
+)
+_CITATION_AIR_RE = re.compile(
+    r"\bAIR\s+(?:19|20)\d{2}\s+(?:SC|SCC|HC|AP|Bom|Cal|Del|Ker|Mad)\s+\d+\b",
+    re.IGNORECASE,
+)
+
+
 def _extract_citation(text: str) -> Optional[str]:
     """
     Extract a law reporter citation: e.g. (2021) 3 SCC 456,  AIR 2020 SC 123.
     """
     # "(YYYY) Vol Reporter PageNo"
-    m = re.search(
-        r"\(((19|20)\d{2})\)\s+\d+\s+(SCC|AIR|SCR|MLJ|ALT|ALR|ALJR|HLR|BLR|CLR)\s+\d+",
-        text, re.IGNORECASE
-    )
+    m = _CITATION_REPORTER_RE.search(text)
     if m:
         return m.group(0).strip()
     # "AIR YYYY SC/HC PageNo"
-    m = re.search(
-        r"\bAIR\s+(19|20)\d{2}\s+(SC|SCC|HC|AP|Bom|Cal|Del|Ker|Mad)\s+\d+\b",
-        text, re.IGNORECASE
-    )
+    m = _CITATION_AIR_RE.search(text)
     if m:
         return m.group(0).strip()
     return None
@@ -662,40 +749,37 @@ def _extract_dates(text: str) -> Tuple[Optional[str], Optional[str], Optional[st
 
     for line in header.splitlines():
         up = line.upper()
+        if not _DATE_LABEL_RE.search(up):
+            continue
 
         # Filing date: labeled only — never infer from year
-        if re.search(
-            r"FILED ON|FILING DATE|DATE OF FILING|PRESENTED ON|PRESENTATION DATE"
-            r"|DATE OF PRESENTATION",
-            up
-        ):
+        if _FILING_LABEL_RE.search(up):
             d = _parse_date(line)
             if d and not filing:
                 filing = d
 
         # Registration date
-        elif re.search(r"REGISTRATION DATE|REGISTERED ON", up):
+        elif _REGISTRATION_LABEL_RE.search(up):
             d = _parse_date(line)
             if d and not registration:
                 registration = d
 
         # Decision / Judgment date (primary)
-        elif re.search(
-            r"DECIDED ON|JUDGMENT ON|JUDGMENT DATE|ORDER DATED|DATED:\s*"
-            r"|PRONOUNCED ON|DATE OF PRONOUNCEMENT|DATE OF DECISION"
-            r"|JUDGEMENT ON|DATE OF JUDGEMENT",
-            up
-        ):
+        elif _DECISION_LABEL_RE.search(up):
             d = _parse_date(line)
             if d and not decision:
                 decision = d
 
         # "Heard on" — only use as decision_date fallback if nothing better found
-        elif re.search(r"HEARD ON|HEARING DATE|ARGUED ON", up):
+        elif _HEARD_LABEL_RE.search(up):
             d = _parse_date(line)
             if d and not heard_on:
                 heard_on = d
 
+        # Later lines can't change anything once all three are set
+        if filing and registration and decision:
+            break
+
     # Use "Heard on" date only as last resort for decision_date
     if not decision and heard_on:
         decision = heard_on
@@ -703,16 +787,20 @@ def _extract_dates(text: str) -> Tuple[Optional[str], Optional[str], Optional[st
     return filing, registration, decision
 
 
-def _extract_title(text: str, case_number: Optional[str]) -> Optional[str]:
+# Court-name / boilerplate lines that never make a title (matched on the upper-cased line)
+_TITLE_SKIP_RE = re.compile(r"IN THE|BEFORE THE|HIGH COURT|SUPREME COURT")
+
+
+def _extract_title(all_lines: List[str], case_number: Optional[str]) -> Optional[str]:
     """
     Build a clean title from first non-empty line or petitioner vs respondent.
     Never use the raw first line if it's just the court name.
     """
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
-    for line in lines[:10]:
+    stripped = (l.strip() for l in all_lines)
+    for line in islice((l for l in stripped if l), 10):
         up = line.upper()
         # Skip lines that are just the court name or boilerplate
-        if any(kw in up for kw in ["IN THE", "BEFORE THE", "HIGH COURT", "SUPREME COURT"]):
+        if _TITLE_SKIP_RE.search(up):
             continue
         if len(line) > 20:
             return line[:200]
@@ -723,7 +811,7 @@ def _extract_title(text: str, case_number: Optional[str]) -> Optional[str]:
 # PUBLIC API
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def extract_case_metadata(full_text: str) -> Dict[str, Optional[str]]:
+def _extract_case_metadata(full_text: str) -> Dict[str, Optional[str]]:
     """
     Stage 1–4 pipeline: deterministic metadata extraction from court document header.
 
@@ -737,18 +825,19 @@ def extract_case_metadata(full_text: str) -> Dict[str, Optional[str]]:
     Fields that cannot be confidently extracted → None (stored as SQL NULL).
     """
     # ── STAGE 1: Prepare header text ──────────────────────────────────────────
-    # Cleaned lines + uppercase string for pattern matching
-    lines, _upper = _prepare_header(full_text, n=80)
+    # Cleaned lines, their uppercase twins, and one uppercase string for pattern matching
+    all_lines = full_text.splitlines()     # split once; helpers take slices
+    lines, upper_lines, _upper = _prepare_header(all_lines, n=80)
 
     # ── STAGE 2: Extract fields from zones ────────────────────────────────────
 
     # STEP 1: Court (TOP ZONE — first 10 lines after cleaning)
-    court_name, court_level, bench = _extract_court(lines)
+    court_name, court_level, bench = _extract_court(lines, upper_lines)
 
     # Find the court line index for proximity scoring in case number extraction
     court_line_idx = 0
-    for i, line in enumerate(lines[:15]):
-        if any(t in line.upper() for t in _COURT_LINE_TRIGGERS):
+    for i, up in enumerate(upper_lines[:15]):
+        if _COURT_LINE_TRIGGER_RE.search(up):
             court_line_idx = i
             break
 
@@ -758,20 +847,20 @@ def extract_case_metadata(full_text: str) -> Dict[str, Optional[str]]:
     # STEP 3: Case type — determined solely from prefix in CASE_TYPE_MAP (no AI)
 
     # STEP 4: Parties (MIDDLE ZONE — lines 5–80)
-    petitioner, respondent = _extract_parties(lines)
+    petitioner, respondent = _extract_parties(lines, upper_lines)
 
     # STEP 5: Judge names
-    judge_names = _extract_judges(lines)
+    judge_names = _extract_judges(lines, upper_lines)
 
     # ── Bonus fields ──────────────────────────────────────────────────────────
-    advocates  = _extract_advocates(full_text)
+    advocates  = _extract_advocates(all_lines)
     disposition = _extract_disposition(full_text)
     citation    = _extract_citation(full_text)
     filing_date, registration_date, decision_date = _extract_dates(full_text)
 
     # ── STEP 6: Validation ────────────────────────────────────────────────────
     # case_number must contain a 4-digit year
-    if case_number and not re.search(r"(19|20)\d{2}", case_number):
+    if case_number and not _YEAR_RE.search(case_number):
         case_number = None
         case_type = None
         case_year = None
@@ -792,7 +881,7 @@ def extract_case_metadata(full_text: str) -> Dict[str, Optional[str]]:
     if petitioner and respondent:
         title = f"{petitioner} vs {respondent}"
     else:
-        title = _extract_title(full_text, case_number)
+        title = _extract_title(all_lines, case_number)
 
     return {
         # Core identification
@@ -826,48 +915,99 @@ def extract_case_metadata(full_text: str) -> Dict[str, Optional[str]]:
     }
 
 
-def validate_metadata_for_sql(meta: Dict) -> Tuple[bool, Optional[str]]:
-    """
-    Validate extracted metadata before inserting into the `cases` SQL table.
+# Re-ingested documents (retries, reindexing) return the cached dict. Keyed on a
+# 16-byte blake2b of the full text, since disposition / advocates / citation read
+# past the header; only digests are kept, never the texts themselves.
+_METADATA_CACHE_SIZE = 2048
+_metadata_cache: "OrderedDict[bytes, Dict[str, Optional[str]]]" = OrderedDict()
+_metadata_cache_lock = threading.Lock()
 
-    Mandatory fields per final spec:
-      1. case_number  — must contain (19xx|20xx) year, must NOT be internal CASE-... ID
-      2. court_level  — must not be null/empty
-      3. petitioner   — must be a valid party name (not null)
-      4. respondent   — must be a valid party name (not null)
 
-    Title is always derived from petitioner+respondent so is never checked separately.
-    All other fields (judge_names, advocates, dates, etc.) are optional.
-
-    Returns:
-      (True,  None)       — all checks pass, safe to INSERT
-      (False, reason_str) — at least one check failed; caller must skip and log
+def extract_case_metadata(full_text: str) -> Dict[str, Optional[str]]:
+    """
+    Deterministic metadata for full_text (see _extract_case_metadata), memoised
+    per text. Returns a fresh dict, so callers may modify it.
+    """
+    key = hashlib.blake2b(full_text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _metadata_cache_lock:
+        cached = _metadata_cache.get(key)
+        if cached is not None:
+            _metadata_cache.move_to_end(key)
+            return dict(cached)
+
+    meta = _extract_case_metadata(full_text)
+    with _metadata_cache_lock:
+        _metadata_cache[key] = meta
+        _metadata_cache.move_to_end(key)
+        while len(_metadata_cache) > _METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
+    return dict(meta)
+
+
+def extract_case_metadata_batch(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> List[Dict[str, Optional[str]]]:
     """
-    issues = []
+    extract_case_metadata over many documents, fanned out across worker processes
+    (the extractor is pure-Python CPU work, so threads would serialise on the GIL).
+    Results are in input order. workers=None uses os.cpu_count(); chunksize
+    documents are shipped per task to amortise the pickling round-trip.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(extract_case_metadata, texts, chunksize=chunksize))
+
 
+def _metadata_issues(meta: Dict) -> Iterator[str]:
+    """Rule violations for validate_metadata_for_sql, produced lazily in rule order."""
     # Rule 1: case_number — must contain 4-digit year, must not be internal placeholder
     cn = (meta.get("case_number") or "").strip()
     if not cn or cn.upper().startswith("CASE-"):
-        issues.append(f"case_number is missing or internal placeholder ('{cn}')")
-    elif not re.search(r"(19|20)\d{2}", cn):
-        issues.append(f"case_number '{cn}' does not contain a 4-digit year")
+        yield f"case_number is missing or internal placeholder ('{cn}')"
+    elif not _YEAR_RE.search(cn):
+        yield f"case_number '{cn}' does not contain a 4-digit year"
 
     # Rule 2: court_level must exist
     court_level = (meta.get("court_level") or "").strip()
     if not court_level or court_level.lower() in ("none", "unknown"):
-        issues.append("court_level is missing (court line must contain COURT/TRIBUNAL/BENCH)")
+        yield "court_level is missing (court line must contain COURT/TRIBUNAL/BENCH)"
 
     # Rule 3: petitioner must be a valid party name
-    petitioner = (meta.get("petitioner") or "").strip()
-    if not petitioner:
-        issues.append("petitioner is missing or could not be extracted")
+    if not (meta.get("petitioner") or "").strip():
+        yield "petitioner is missing or could not be extracted"
 
     # Rule 4: respondent must be a valid party name
-    respondent = (meta.get("respondent") or "").strip()
-    if not respondent:
-        issues.append("respondent is missing or could not be extracted")
+    if not (meta.get("respondent") or "").strip():
+        yield "respondent is missing or could not be extracted"
+
 
-    if issues:
-        return False, "; ".join(issues)
+def validate_metadata_for_sql(meta: Dict, collect_all: bool = False) -> Tuple[bool, Optional[str]]:
+    """
+    Validate extracted metadata before inserting into the `cases` SQL table.
+
+    Mandatory fields per final spec:
+      1. case_number  — must contain (19xx|20xx) year, must NOT be internal CASE-... ID
+      2. court_level  — must not be null/empty
+      3. petitioner   — must be a valid party name (not null)
+      4. respondent   — must be a valid party name (not null)
+
+    Title is always derived from petitioner+respondent so is never checked separately.
+    All other fields (judge_names, advocates, dates, etc.) are optional.
+
+    Checking stops at the first failed rule; collect_all=True evaluates every rule
+    and reports all failures joined with "; " (for stored/displayed reasons).
+
+    Returns:
+      (True,  None)       — all checks pass, safe to INSERT
+      (False, reason_str) — at least one check failed; caller must skip and log
+    """
+    issues = _metadata_issues(meta)
+    if not collect_all:
+        first = next(issues, None)
+        return first is None, first
+    found = list(issues)
+    if found:
+        return False, "; ".join(found)
     return True, None
 
@@ -0,0 +1,100 @@
+"""
+Optional deep-learning OCR engines, selected with OCR_BACKEND.
+
+"tesseract" (default) keeps the CPU path in ocr_processor. "paddle" (PaddleOCR)
+and "easyocr" run text detection and recognition on a CUDA GPU when one is
+available (OCR_GPU=0 forces CPU). Pages are handed over as greyscale numpy
+arrays a batch at a time, and the detected text lines of each page go through
+the recognition network together. The package is only imported, and its model
+loaded, on first use; calls are serialised, one inference at a time, which keeps
+GPU memory bounded. OcrBatcher runs these engines in the server process rather
+than in its worker processes, so a server holds one model.
+"""
+
+import functools
+import importlib.util
+import logging
+import os
+import threading
+from importlib import metadata
+from typing import List
+
+import numpy as np
+
+OCR_BACKEND = os.getenv("OCR_BACKEND", "tesseract").strip().lower()
+OCR_GPU = os.getenv("OCR_GPU", "1") != "0"
+# Text lines recognised per forward pass
+OCR_GPU_BATCH = max(1, int(os.getenv("OCR_GPU_BATCH", "32")))
+
+_backend = None
+_warned = False
+_backend_lock = threading.Lock()
+logger = logging.getLogger(__name__)
+
+
+class PaddleBackend:
+    def __init__(self, use_gpu: bool = OCR_GPU) -> None:
+        import paddleocr
+        self._ocr = paddleocr.PaddleOCR(
+            lang="en", use_angle_cls=False, use_gpu=use_gpu, rec_batch_num=OCR_GPU_BATCH, show_log=False,
+        )
+        self._lock = threading.Lock()
+
+    def batch(self, images: List[np.ndarray]) -> List[str]:
+        texts = []
+        with self._lock:
+            for image in images:
+                result = self._ocr.ocr(image, cls=False)
+                lines = (result or [None])[0] or []      # [[box, (text, confidence)], ...] top to bottom
+                texts.append("\n".join(text for _, (text, _) in lines))
+        return texts
+
+
+class EasyOcrBackend:
+    def __init__(self, use_gpu: bool = OCR_GPU) -> None:
+        import easyocr
+        self._reader = easyocr.Reader(["en"], gpu=use_gpu, verbose=False)
+        self._lock = threading.Lock()
+
+    def batch(self, images: List[np.ndarray]) -> List[str]:
+        with self._lock:
+            return [
+                "\n".join(self._reader.readtext(image, detail=0, paragraph=True, batch_size=OCR_GPU_BATCH))
+                for image in images
+            ]
+
+
+# OCR_BACKEND value -> (package, engine class)
+_BACKENDS = {"paddle": ("paddleocr", PaddleBackend), "easyocr": ("easyocr", EasyOcrBackend)}
+
+
+@functools.lru_cache(maxsize=1)
+def available() -> bool:
+    """True when OCR_BACKEND names a deep-learning engine whose package is installed (without importing it)."""
+    entry = _BACKENDS.get(OCR_BACKEND)
+    return entry is not None and importlib.util.find_spec(entry[0]) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def engine_tag() -> str:
+    """Cache-key tag for the selected engine and its version (does not import it)."""
+    try:
+        version = metadata.version(_BACKENDS[OCR_BACKEND][0])
+    except metadata.PackageNotFoundError:
+        version = ""
+    return f"{OCR_BACKEND} {version}"
+
+
+def get_backend():
+    """The selected engine (loading its model on first call), or None for Tesseract."""
+    global _backend, _warned
+    if not available():
+        if OCR_BACKEND != "tesseract" and not _warned:
+            _warned = True
+            logger.warning("OCR_BACKEND=%s is unavailable; using Tesseract", OCR_BACKEND)
+        return None
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _BACKENDS[OCR_BACKEND][1]()
+    return _backend
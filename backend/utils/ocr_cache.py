@@ -0,0 +1,65 @@
+"""
+Content-addressed on-disk cache for extracted document text.
+
+Keys are digests of the file bytes plus whatever produced the text (engine and
+version), so an edited file or a Tesseract upgrade simply misses. One UTF-8 file
+per key under OCR_CACHE_DIR; writes go through a temp file + os.replace so OCR
+worker processes sharing the directory never read a partial entry.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Optional
+
+# Empty string disables the cache
+OCR_CACHE_DIR = os.getenv("OCR_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "mini-pro", "ocr"))
+logger = logging.getLogger(__name__)
+
+
+def enabled() -> bool:
+    return bool(OCR_CACHE_DIR)
+
+
+def make_key(data: bytes, *parts: str) -> str:
+    """128-bit BLAKE2b hex digest of data and the given producer tags."""
+    digest = hashlib.blake2b(data, digest_size=16)
+    for part in parts:
+        digest.update(b"\0" + part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(OCR_CACHE_DIR, key[:2], key + ".txt")
+
+
+def get(key: str) -> Optional[str]:
+    if not OCR_CACHE_DIR:
+        return None
+    try:
+        with open(_entry_path(key), encoding="utf-8", errors="surrogatepass", newline="") as fh:
+            return fh.read()
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        logger.warning("OCR cache read failed for %s: %s", key, exc)
+        return None
+
+
+def put(key: str, text: str) -> None:
+    if not OCR_CACHE_DIR:
+        return
+    path = _entry_path(key)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8", errors="surrogatepass", newline="") as fh:
+            fh.write(text)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning("OCR cache write failed for %s: %s", key, exc)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass